@@ -1,11 +1,13 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
-import plotly.express as px
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor, wait
 from decimal import Decimal
-from database.utils import decimal_to_float
 from datetime import datetime
 import re
+import functools
+from database.pool import MAX_POOL_CONNECTIONS
 
 TYPE_TO_CATEGORY_PATTERNS = [
     # --- numerics ---
@@ -35,8 +37,9 @@ TYPE_TO_CATEGORY_PATTERNS = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
 def canonical_category(sql_type: str) -> str:
-    """Return a canonical category for a DB type string."""
+    """Return a canonical category for a DB type string (memoized, a table repeats its types)."""
     t = sql_type.strip().lower()
     # Strip length/precision e.g. varchar(50), number(10,2)
     t = re.sub(r'\(.*?\)', '', t).strip()
@@ -52,15 +55,146 @@ def canonical_category(sql_type: str) -> str:
     return 'other'
 
 
-def get_all_tables_and_views(connector, schema):
+# Schema metadata rarely changes, so catalog lookups are reused across reruns
+CATALOG_CACHE_TTL = 300
+
+
+@st.cache_data(ttl=CATALOG_CACHE_TTL, show_spinner=False)
+def get_all_tables_and_views(_connector, cache_key, schema):
     """Get all tables and views from the database"""
-    return connector.get_all_tables_and_views(schema)
+    return [tuple(row) for row in _connector.get_all_tables_and_views(schema)]
+
+
+@st.cache_data(ttl=CATALOG_CACHE_TTL, show_spinner=False)
+def get_columns(_connector, cache_key, schema, table):
+    """Get column information for a table"""
+    return [tuple(row) for row in _connector.get_columns(schema, table)]
+
+
+# Column statistics are keyed by a freshness tag, so the TTL only bounds memory use
+COLUMN_STATS_CACHE_TTL = 600
+
+
+@st.cache_data(ttl=COLUMN_STATS_CACHE_TTL, show_spinner=False)
+def get_cached_table_column_details(_connector, cache_key, schema, table, columns, freshness_tag, exact_counts,
+                                    sample_percent):
+    """Get details for all columns of a table, reused while the table is unchanged"""
+    return _connector.get_table_column_details(schema, table, columns)
+
+
+def get_table_column_details(connector, schema, table, columns, freshness_tag):
+    """Get details for all columns of a table, from cache when its freshness tag allows"""
+    if freshness_tag is None:
+        return connector.get_table_column_details(schema, table, columns)
+    return get_cached_table_column_details(connector, connector.cache_key, schema, table,
+                                           columns, freshness_tag, connector.exact_counts,
+                                           connector.sample_percent)
+
+
+@st.cache_data(ttl=COLUMN_STATS_CACHE_TTL, show_spinner=False)
+def get_cached_table_analysis(_connector, cache_key, schema, table, freshness_tag, exact_counts):
+    """Get table statistics, reused while the table is unchanged"""
+    return _connector.get_table_analysis(schema, table)
+
+
+def get_table_analysis(connector, schema, table, freshness_tag):
+    """Get table statistics, from cache when its freshness tag allows"""
+    if freshness_tag is None:
+        return connector.get_table_analysis(schema, table)
+    return get_cached_table_analysis(connector, connector.cache_key, schema, table, freshness_tag,
+                                     connector.exact_counts)
+
+
+def clear_catalog_cache():
+    """Drop cached catalog lookups so the next rerun reads fresh metadata"""
+    get_all_tables_and_views.clear()
+    get_columns.clear()
+
+
+# Upper bound on concurrent per-column queries; kept below the pool size so the page
+# connection and at least one other session always fit
+MAX_ANALYSIS_WORKERS = min(8, MAX_POOL_CONNECTIONS - 2)
+
+# Rows per round-trip when streaming raw column values to the client
+FETCH_ARRAYSIZE = 10000
+
+# Cap on raw values pulled to the client when a histogram cannot be binned in the database
+HISTOGRAM_SAMPLE_ROWS = 10000
+
+
+def fetch_col_viz_data(connector, schema, table, col_name, category):
+    """Run the visualization queries for a column (no Streamlit calls)"""
+    if category == 'numeric':
+        histogram, box_stats = connector.get_numeric_profile(schema, table, col_name, n_buckets=10)
+        viz_data = {'histogram': histogram, 'box_stats': box_stats}
+        if viz_data['box_stats'] is None:
+            # No server-side box statistics: fall back to the grouped value counts
+            viz_data['value_counts'] = connector.get_value_counts(schema, table, col_name)
+        return viz_data
+    if category == 'text':
+        # Exact top values plus an 'others' total in one query, when the connector supports it
+        top_values = connector.get_top_values(schema, table, col_name, n=9)
+        if top_values is not None:
+            return {'top_values': top_values}
+        return {'value_counts': connector.get_value_counts(schema, table, col_name)}
+    return {}
+
+
+@st.cache_data(ttl=COLUMN_STATS_CACHE_TTL, show_spinner=False)
+def get_cached_col_viz_data(_connector, cache_key, schema, table, col_name, category, freshness_tag,
+                            sample_percent):
+    """Get visualization data for a column, reused while the table is unchanged"""
+    return fetch_col_viz_data(_connector, schema, table, col_name, category)
+
 
-def analyze_table(connector, schema: str, table: str, object_type: str = 'TABLE'):
-    """Analyze a specific table or view"""
+def get_col_viz_data(connector, schema, table, col_name, category, freshness_tag):
+    """Get visualization data for a column, from cache when the table's freshness tag allows"""
+    if freshness_tag is None:
+        return fetch_col_viz_data(connector, schema, table, col_name, category)
+    return get_cached_col_viz_data(connector, connector.cache_key, schema, table, col_name, category,
+                                   freshness_tag, connector.sample_percent)
+
+
+def _get_col_viz_data_worker(connector, schema, table, col_name, category, freshness_tag):
+    with connector.worker() as worker:
+        if worker is None:
+            # No spare connection; the main thread fetches this column while rendering
+            return None
+        return get_col_viz_data(worker, schema, table, col_name, category, freshness_tag)
+
+
+def prefetch_viz_data(connector, schema, table, categories, freshness_tag):
+    """Start visualization queries for every column on worker connections.
+
+    Returns a dict of column name -> Future, or an empty dict when the
+    connector cannot run queries concurrently. A future resolves to None
+    when no pooled connection was free for it.
+    """
+    if not connector.supports_concurrent_queries:
+        return {}
+    # Workers share the session's script context, so st.cache_data works on them
+    executor = ThreadPoolExecutor(max_workers=MAX_ANALYSIS_WORKERS, initializer=add_script_run_ctx,
+                                  initargs=(None, get_script_run_ctx()))
+    futures = {}
+    for col_name, category in categories.items():
+        if category in ('numeric', 'text'):
+            futures[col_name] = executor.submit(_get_col_viz_data_worker, connector, schema, table,
+                                                col_name, category, freshness_tag)
+    # Queued work keeps running; results are collected while rendering
+    executor.shutdown(wait=False)
+    return futures
+
+
+def analyze_table(connector, schema: str, table: str, object_type: str = 'TABLE',
+                  show_visualizations: bool = True):
+    """Analyze a specific table or view; charts and their queries are skipped unless show_visualizations"""
+    viz_futures = {}
     try:
+        # Cached results for this table stay valid while its freshness tag is unchanged
+        freshness_tag = connector.get_freshness_tag(schema, table)
+
         # Get table statistics
-        table_stats = connector.get_table_analysis(schema, table)
+        table_stats = get_table_analysis(connector, schema, table, freshness_tag)
         #st.write("DEBUG: table_stats =", table_stats)
         
         # Display table statistics
@@ -82,89 +216,54 @@ def analyze_table(connector, schema: str, table: str, object_type: str = 'TABLE'
                 last_analyzed = last_analyzed.strftime('%Y-%m-%d %H:%M:%S')
             st.metric("Last Analyzed", last_analyzed or 'Never')
         
-        # Get columns
-        columns = connector.get_columns(schema, table)
+        # Get columns; table statistics already carry them, except where a connector leaves them out (e.g. views)
+        columns = [tuple(col) for col in table_stats.get('columns') or []]
+        if not columns:
+            columns = get_columns(connector, connector.cache_key, schema, table)
         #st.write("DEBUG: columns =", columns)
         
-        # Get sample data
-        sample_data = connector.get_sample_data(schema, table)
-        #st.write("DEBUG: sample_data[0:3] =", sample_data[:3] if sample_data else "EMPTY")
-        
-        # Get column names
-        col_names = [col[0] for col in columns]
-        #st.write("DEBUG: col_names =", col_names)
-        
-        # DataFrame creation
-        if sample_data:
-            # Ensure pyodbc.Row is converted to tuple
-            if hasattr(sample_data[0], '__class__') and sample_data[0].__class__.__name__ == 'Row':
-                sample_data = [tuple(row) for row in sample_data]
-            df_sample = pd.DataFrame(sample_data, columns=col_names)
-            #st.write("DEBUG: df_sample.head()", df_sample.head())
-            #st.dataframe(df_sample)
-        
+        # Get details for all columns at once
+        all_details = get_table_column_details(connector, schema, table, columns, freshness_tag)
+
+        # Resolve types, categories and average widths up front, so every column's ratio uses the full total
+        formatted_types = {}
+        column_widths = {}
+        categories = {}
+        for col in columns:
+            col_details = all_details.get(col[0])
+            if col_details:
+                categories[col[0]] = canonical_category(col_details['data_type'].lower())
+            formatted_types[col[0]] = format_column_type(col)
+            column_widths[col[0]] = estimate_column_width(col, col_details.get('metrics', {}) if col_details else {})
+        total_width = sum(v or 0 for v in column_widths.values())
+
+        # Fan the per-column visualization queries out to pooled connections
+        if show_visualizations:
+            # Plotly is imported on first use, so views without charts never load it
+            import plotly.express as px
+            import plotly.graph_objects as go
+            viz_futures = prefetch_viz_data(connector, schema, table, categories, freshness_tag)
+
         # Get column statistics
         st.subheader("Column Statistics")
-        # Calculate average column widths
-        column_widths = {}
+
+        # The SQL dialect and quoted table name are the same for every column
+        dbtype = sql_dialect(connector)
+        quoted_table = sql_quote_table(schema, table, dbtype)
 
         for col in columns:
             col_name = col[0]
             st.subheader(col_name)
+            formatted_type = formatted_types[col_name]
+            col_details = all_details.get(col_name)
 
-
-            data_type = (col[1] or "").lower()
-            max_length = col[3] or 0
-            precision = col[4] or 0
-            scale = col[5] or 0
-
-
-            # Format data type with constraints (safe formatting)
-            formatted_type = data_type
-            if max_length > 0:
-                formatted_type += f"({max_length})"
-            elif precision > 0 and scale > 0:
-                formatted_type += f"({precision},{scale})"
-            elif precision > 0:
-                formatted_type += f"({precision})"
-
-            col_details = connector.get_column_details(schema, table, col_name)
-            metrics = col_details.get('metrics', {}) if col_details else {}
-
-            if data_type in ['varchar', 'char', 'text', 'longtext', 'mediumtext', 'tinytext', 'nvarchar', 'nchar', 'ntext']:
-                column_widths[col_name] = metrics.get('avg_length') or 0
-
-            elif data_type in ['int', 'bigint', 'smallint', 'tinyint']:
-                type_sizes = {'tinyint': 1, 'smallint': 2, 'int': 4, 'bigint': 8}
-                column_widths[col_name] = type_sizes.get(data_type, 4)
-
-            elif data_type in ['decimal', 'numeric']:
-                p = precision
-                s = scale
-                # fallback to metric if defined
-                p = metrics.get('precision', p) or 0
-                s = metrics.get('scale', s) or 0
-                column_widths[col_name] = (p * 4 + 8) // 8 if p else 0
-
-            elif data_type in ['float', 'double']:
-                column_widths[col_name] = 4 if data_type == 'float' else 8
-
-            elif data_type == 'date':
-                column_widths[col_name] = 3
-
-            elif data_type in ['datetime', 'timestamp']:
-                column_widths[col_name] = 8
-
-            else:
-                column_widths[col_name] = max_length or metrics.get('max_length', 0)
-
-            
             # Create tabs for each column
-            stat_tab, viz_tab = st.tabs(["Statistics", "Visualizations"])
+            if show_visualizations:
+                stat_tab, viz_tab = st.tabs(["Statistics", "Visualizations"])
+            else:
+                stat_tab = st.container()
             
             with stat_tab:
-                # Get column details
-                col_details = connector.get_column_details(schema, table, col_name)
                 #st.write(f"DEBUG: col_details for {col_name} (stat_tab) =", col_details)
                 if not col_details:
                     st.warning(f"Could not get details for column {col_name}")
@@ -174,15 +273,16 @@ def analyze_table(connector, schema: str, table: str, object_type: str = 'TABLE'
                 col1, col2 = st.columns(2)
                 with col1:
                     st.metric("Data Type", formatted_type)
-                    st.metric("Distinct Values", f"{col_details['distinct_count']:,}")
-                    st.metric("Unique Values", f"{col_details.get('unique_count', 0):,}")
+                    st.metric("Distinct Values", format_count(col_details['distinct_count']))
+                    st.metric("Unique Values", format_count(col_details.get('unique_count')))
                 with col2:
-                    st.metric("Null Values", f"{col_details['null_count']:,}")
-                    st.metric("Null Percentage", f"{(col_details['null_count'] / table_stats['row_count'] * 100):.2f}%")
+                    null_count = col_details['null_count']
+                    st.metric("Null Values", format_count(null_count))
+                    st.metric("Null Percentage", f"{(null_count / table_stats['row_count'] * 100):.2f}%"
+                              if null_count is not None and table_stats['row_count'] else "n/a")
                 
                 # Display column width information
                 col_width = column_widths.get(col_name, 0)
-                total_width = sum(v or 0 for v in column_widths.values())
 
                 width_percentage = (col_width / total_width * 100) if total_width > 0 else 0
                 
@@ -200,115 +300,130 @@ def analyze_table(connector, schema: str, table: str, object_type: str = 'TABLE'
                     for i, (metric_name, value) in enumerate(metrics.items()):
                         if isinstance(value, datetime):
                             value = value.strftime('%Y-%m-%d %H:%M:%S')
-                        elif isinstance(value, float):
-                            value = f"{value:.2f}"
+                        else:
+                            value = format_metric(value)
                         with metric_cols[i]:
                             st.metric(metric_name.replace('_', ' ').title(), str(value))
+
+            if not show_visualizations:
+                st.write("---")
+                continue
             
             with viz_tab:
-
-
-                # Get column details for visualizations
-                col_details = connector.get_column_details(schema, table, col_name)
-                data_type = (col_details.get('data_type') or '').lower()
-                category = canonical_category(data_type)
-                # st.write(f"DEBUG: {col_name} data_type={data_type} -> category={category}")
-                if not col_details:
-                    st.warning(f"Could not get details for column {col_name}")
-                    continue
-                
-                # Add visualizations based on data type
-                data_type = col_details['data_type'].lower()
-                #st.write(f"DEBUG: data_type for {col_name} (viz_tab) = {data_type}")
-                category = canonical_category(data_type)
-
-                # st.write(f"DEBUG: {col_name} data_type={data_type} -> category={category}")
-                if category == 'numeric':
-                    # Get value distribution for numeric columns
-                    value_counts = connector.get_value_counts(schema, table, col_name)
-                    #st.write(f"DEBUG: value_counts for {col_name} (viz_tab) =", value_counts[:10] if value_counts else "EMPTY")
-                    if value_counts:
-                        #st.write(f"DEBUG: type(value_counts[0]) = {type(value_counts[0])}, value_counts[0] = {value_counts[0]}")
-                        # Flatten if needed
-                        if len(value_counts) > 0 and len(value_counts[0]) == 1 and isinstance(value_counts[0][0], tuple):
-                            value_counts = [row[0] for row in value_counts]
-                            #st.write("DEBUG: value_counts flattened =", value_counts[:10])
-                        # Convert pyodbc.Row to tuple if needed
-                        if hasattr(value_counts[0], '__class__') and value_counts[0].__class__.__name__ == 'Row':
-                            value_counts = [tuple(row) for row in value_counts]
-                            #st.write("DEBUG: value_counts converted to tuple =", value_counts[:10])
-                        df_counts = pd.DataFrame(value_counts, columns=['value', 'count'])
-                        #st.write(f"DEBUG: df_counts for {col_name} (viz_tab) =", df_counts.head())
-                        df_counts['value'] = pd.to_numeric(df_counts['value'])
-                        # Height-balanced histogram (quantile-based)
-                        try:
-                            dbtype = 'mysql'
-                            if 'postgres' in connector.__class__.__name__.lower():
-                                dbtype = 'postgresql'
-                            elif 'mssql' in connector.__class__.__name__.lower():
-                                dbtype = 'mssql'
-                            elif 'oracle' in connector.__class__.__name__.lower():
-                                dbtype = 'oracle'
+                # Add visualizations based on data type, resolved once per column above
+                category = categories[col_name]
+
+                # Results are rendered in column order, whichever query finished first
+                try:
+                    future = viz_futures.get(col_name)
+                    viz_data = future.result() if future else None
+                    if viz_data is None:
+                        viz_data = get_col_viz_data(connector, schema, table, col_name, category, freshness_tag)
+                except Exception as e:
+                    # Fall through without charts, so the column still gets its separator
+                    st.info(f"Could not load visualization data: {e}")
+                    viz_data = None
+
+                # st.write(f"DEBUG: {col_name} category={category}")
+                if viz_data is None:
+                    pass
+                elif category == 'numeric':
+                    # Height-balanced histogram (quantile-based), binned in the database when supported
+                    try:
+                        histogram = viz_data['histogram']
+                        if histogram is not None:
+                            counts = [row[2] for row in histogram]
+                            bin_labels = [f"{row[0]:.2f}" if row[0] == row[1] else f"{row[0]:.2f} - {row[1]:.2f}"
+                                          for row in histogram]
+                        else:
+                            counts = bin_labels = None
                             quoted_col = sql_quote_identifier(col_name, dbtype)
-                            quoted_table = sql_quote_table(schema, table, dbtype)
-                            limit_clause = 'LIMIT 10000' if dbtype in ['mysql', 'postgresql'] else ('TOP 10000' if dbtype == 'mssql' else '')
+                            # Cast in SQL so the driver returns floats instead of Decimal objects
+                            float_col = f"{sql_cast_float(quoted_col, dbtype)} AS {quoted_col}"
                             if dbtype == 'mssql':
-                                query = f"SELECT TOP 10000 {quoted_col} FROM {quoted_table} WHERE {quoted_col} IS NOT NULL"
+                                query = f"SELECT TOP {HISTOGRAM_SAMPLE_ROWS} {float_col} FROM {quoted_table} WHERE {quoted_col} IS NOT NULL"
+                            elif dbtype == 'oracle':
+                                query = f"SELECT {float_col} FROM {quoted_table} WHERE {quoted_col} IS NOT NULL AND ROWNUM <= {HISTOGRAM_SAMPLE_ROWS}"
                             else:
-                                query = f"SELECT {quoted_col} FROM {quoted_table}"
-                            df_col = pd.read_sql(query, connector.connection)
-                            #st.write(f"DEBUG: df_col for {col_name} (viz_tab) =", df_col.head())
-                            if not df_col.empty:
-                                bin_edges, counts, bin_labels = height_balanced_histogram(df_col[col_name], n_buckets=10)
-                                fig = px.bar(x=bin_labels, y=counts, labels={'x': 'Value Range', 'y': 'Count'},
-                                            title=f"Height-Balanced Histogram for {col_name}")
-                                st.plotly_chart(fig)
-
-                        except Exception as e:
-                            st.info(f"Could not plot height-balanced histogram: {e}")
-                            #st.write(f"DEBUG: Exception in histogram for {col_name} (viz_tab):", str(e))
-                            # Create box plot
-                        fig = px.box(df_counts, y='value',
-                                    title=f"Box Plot for {col_name}")
-                        #st.write(f"DEBUG: Box Plot for {col_name} (viz_tab) created.")
+                                query = f"SELECT {float_col} FROM {quoted_table} WHERE {quoted_col} IS NOT NULL LIMIT {HISTOGRAM_SAMPLE_ROWS}"
+                            # Stream through the connector's cursor in arraysize batches
+                            connector.cursor.arraysize = FETCH_ARRAYSIZE
+                            connector.cursor.execute(query)
+                            values = np.fromiter((row[0] for row in connector.cursor), dtype=np.float64)
+                            #st.write(f"DEBUG: values for {col_name} (viz_tab) =", values[:5])
+                            if values.size:
+                                bin_edges, counts, bin_labels = height_balanced_histogram(values, n_buckets=10)
+                        if counts is not None and len(counts):
+                            fig = px.bar(x=bin_labels, y=counts, labels={'x': 'Value Range', 'y': 'Count'},
+                                        title=f"Height-Balanced Histogram for {col_name}")
+                            st.plotly_chart(fig)
+
+                    except Exception as e:
+                        st.info(f"Could not plot height-balanced histogram: {e}")
+                        #st.write(f"DEBUG: Exception in histogram for {col_name} (viz_tab):", str(e))
+
+                    # Create box plot from the five-number summary, computed in the database when supported
+                    box_stats = viz_data['box_stats']
+                    box_title = f"Box Plot for {col_name}"
+                    value_counts = viz_data.get('value_counts')
+                    #st.write(f"DEBUG: value_counts for {col_name} (viz_tab) =", value_counts[:10] if value_counts else "EMPTY")
+                    if box_stats is None and value_counts:
+                        # Flatten if needed
+                        if len(value_counts[0]) == 1 and isinstance(value_counts[0][0], tuple):
+                            value_counts = [row[0] for row in value_counts]
+                        box_stats = box_stats_from_counts(value_counts)
+                        # Value counts hold only the most frequent values, not the whole column
+                        box_title += f" (top {len(value_counts)} values only)"
+                    if box_stats:
+                        # Only the summary and a bounded sample of outliers reach the browser
+                        low, q1, median, q3, high, outliers = box_stats
+                        fig = go.Figure(go.Box(q1=[q1], median=[median], q3=[q3],
+                                               lowerfence=[low], upperfence=[high], name=col_name))
+                        if outliers:
+                            fig.add_trace(go.Scatter(x=[col_name] * len(outliers), y=outliers, mode='markers',
+                                                     name='Outliers', showlegend=False))
+                        fig.update_layout(title=box_title)
                         st.plotly_chart(fig)
                 elif category == 'text':
                     # Get value counts for text columns
-                    value_counts = connector.get_value_counts(schema, table, col_name)
+                    top9_df = None
+                    value_counts = viz_data.get('value_counts')
                     #st.write(f"DEBUG: value_counts for {col_name} (viz_tab) =", value_counts[:10] if value_counts else "EMPTY")
-                    if value_counts:
+                    if viz_data.get('top_values') is not None:
+                        top_rows, others_count, _ = viz_data['top_values']
+                        if top_rows:
+                            top9_df = pd.DataFrame(top_rows, columns=['value', 'count'])
+                            if others_count > 0:
+                                top9_df.loc[len(top9_df)] = ('Diğer', others_count)
+                    elif value_counts:
                         #st.write(f"DEBUG: type(value_counts[0]) = {type(value_counts[0])}, value_counts[0] = {value_counts[0]}")
                         # Flatten if needed
                         if len(value_counts) > 0 and len(value_counts[0]) == 1 and isinstance(value_counts[0][0], tuple):
                             value_counts = [row[0] for row in value_counts]
                             #st.write("DEBUG: value_counts flattened =", value_counts[:10])
-                        # Convert pyodbc.Row to tuple if needed
-                        if hasattr(value_counts[0], '__class__') and value_counts[0].__class__.__name__ == 'Row':
-                            value_counts = [tuple(row) for row in value_counts]
-                            #st.write("DEBUG: value_counts converted to tuple =", value_counts[:10])
+                        # pandas reads driver rows (e.g. pyodbc.Row) as sequences directly
                         df_counts = pd.DataFrame(value_counts, columns=['value', 'count'])
                         #st.write(f"DEBUG: df_counts for {col_name} (viz_tab) =", df_counts.head())
-                        # Sort and split
-                        df_counts_sorted = df_counts.sort_values('count', ascending=False)
-                        top9_df = df_counts_sorted.head(9)
-                        others_count = df_counts_sorted['count'][9:].sum()
+                        # Pick the top values without sorting the whole frame
+                        top9_df = df_counts.nlargest(9, 'count').reset_index(drop=True)
+                        others_count = int(df_counts['count'].sum()) - int(top9_df['count'].sum())
                         # Append 'Others' if there are more than 9 unique values
                         if others_count > 0:
-                            top9_df = pd.concat([top9_df, pd.DataFrame([{'value': 'Diğer', 'count': others_count}])], ignore_index=True)
-                        else:
-                            # Select top 5 values
-                            top9_df = df_counts_sorted.head(10)
-                        # Create a matrix-like DataFrame for heatmap
-                        heatmap_data = top9_df.pivot_table(index='value', values='count')
-                        #st.write(f"DEBUG: heatmap_data for {col_name} (viz_tab) =", heatmap_data)
-                        # Create heatmap
-                        fig = px.imshow(
-                            heatmap_data,
+                            top9_df.loc[len(top9_df)] = ('Diğer', others_count)
+                    if top9_df is not None:
+                        # Values as text, so numeric-looking ones stay categorical on the axis
+                        top9_df['value'] = top9_df['value'].astype(str)
+                        # Create bar chart
+                        fig = px.bar(
+                            top9_df,
+                            x='value',
+                            y='count',
+                            color='count',
                             color_continuous_scale='Viridis',
-                            labels=dict(x="Frequency", y=col_name, color="Count"),
-                            title=f"Top 10 Values Heatmap for {col_name}"
+                            labels=dict(value=col_name, count="Count"),
+                            title=f"Top 10 Values for {col_name}"
                         )
-                        #st.write(f"DEBUG: Heatmap for {col_name} (viz_tab) created.")
+                        #st.write(f"DEBUG: Bar chart for {col_name} (viz_tab) created.")
                         st.plotly_chart(fig)
             
             st.write("---")
@@ -317,55 +432,108 @@ def analyze_table(connector, schema: str, table: str, object_type: str = 'TABLE'
         st.error(f"Error analyzing table: {str(e)}")
         st.write("Debug - Error type:", type(e).__name__)
         st.write("Debug - Error details:", str(e))
-
-def col_analysis(connector, schema, table, col_info):
+    finally:
+        # Stop queued queries and let running ones return their connections before the caller closes ours
+        for future in viz_futures.values():
+            future.cancel()
+        wait(viz_futures.values())
+
+def format_column_type(col_info):
+    """Format a column's data type with its length or precision"""
+    data_type = (col_info[1] or "").lower()
+    max_length = col_info[3] or 0
+    precision = col_info[4] or 0
+    scale = col_info[5] or 0
+    if max_length > 0:
+        return f"{data_type}({max_length})"
+    elif precision > 0 and scale > 0:
+        return f"{data_type}({precision},{scale})"
+    elif precision > 0:
+        return f"{data_type}({precision})"
+    return data_type
+
+
+# Stored width in bytes of fixed-size types
+FIXED_TYPE_WIDTHS = {
+    'tinyint': 1, 'smallint': 2, 'int': 4, 'bigint': 8,
+    'float': 4, 'double': 8,
+    'date': 3, 'datetime': 8, 'timestamp': 8,
+}
+VARIABLE_TEXT_TYPES = frozenset({'varchar', 'char', 'text', 'longtext', 'mediumtext', 'tinytext',
+                                 'nvarchar', 'nchar', 'ntext'})
+DECIMAL_TYPES = frozenset({'decimal', 'numeric'})
+
+
+def estimate_column_width(col_info, metrics):
+    """Estimate the average stored width of a column in bytes"""
+    data_type = (col_info[1] or "").lower()
+    if data_type in FIXED_TYPE_WIDTHS:
+        return FIXED_TYPE_WIDTHS[data_type]
+    if data_type in VARIABLE_TEXT_TYPES:
+        return metrics.get('avg_length') or 0
+    if data_type in DECIMAL_TYPES:
+        # fallback to metric if defined
+        p = metrics.get('precision', col_info[4] or 0) or 0
+        return (p * 4 + 8) // 8 if p else 0
+    return (col_info[3] or 0) or metrics.get('max_length', 0)
+
+
+def compute_col_stats(connector, schema, table, col_info):
+    """Get the details of a column (no Streamlit calls, safe to run on a worker)"""
+    return connector.get_column_details(schema, table, col_info[0])
+
+
+def col_analysis(connector, schema, table, col_info, col_details=None):
     """Analyze a specific column"""
+    # Get column details unless they were already fetched for the whole table
+    if col_details is None:
+        col_details = compute_col_stats(connector, schema, table, col_info)
+    render_col_stats(col_info, col_details)
+
+
+def format_count(value):
+    """Format a count for display, or 'n/a' when it was not measured"""
+    return 'n/a' if value is None else f"{value:,}"
+
+
+def format_metric(value, numeric_types=(float, Decimal)):
+    """Format a metric for display, with two decimals for numbers of the given types"""
+    if value is None:
+        return 'N/A'
+    if isinstance(value, numeric_types):
+        return f"{value:.2f}"
+    return value
+
+
+def render_col_stats(col_info, col_details):
+    """Write the statistics of a column to the page"""
     col_name = col_info[0]
     data_type = col_info[1]
-    
-    # Get column details
-    col_details = connector.get_column_details(schema, table, col_name)
     metrics = col_details['metrics']
     
     # Display basic statistics
     st.write(f"### Column: {col_name}")
     st.write(f"**Data Type:** {data_type}")
-    st.write(f"**Distinct Values:** {col_details['distinct_count']:,}")
-    st.write(f"**Unique Values:** {col_details.get('unique_count', 0):,}")
-    st.write(f"**Null Values:** {col_details['null_count']:,}")
+    st.write(f"**Distinct Values:** {format_count(col_details['distinct_count'])}")
+    st.write(f"**Unique Values:** {format_count(col_details.get('unique_count'))}")
+    st.write(f"**Null Values:** {format_count(col_details['null_count'])}")
     
     # Display type-specific metrics
     if data_type in ['int', 'bigint', 'smallint', 'tinyint', 'decimal', 'numeric', 'float', 'real', 'money', 'smallmoney']:
         st.write("**Numeric Statistics:**")
-        min_val = metrics.get('min', 'N/A')
-        max_val = metrics.get('max', 'N/A')
-        avg_val = metrics.get('avg', 'N/A')
-        median_val = metrics.get('median', 'N/A')
-        std_dev_val = metrics.get('std_dev', 'N/A')
-        min_val = f"{min_val:.2f}"
-        max_val = f"{max_val:.2f}"
-        avg_val = f"{avg_val:.2f}"
-        median_val = f"{median_val:.2f}"
-        std_dev_val = f"{std_dev_val:.2f}"
-        st.write(f"- Min Value: {min_val}")
-        st.write(f"- Max Value: {max_val}")
-        st.write(f"- Average: {avg_val}")
-        st.write(f"- Median: {median_val}")
-        st.write(f"- Standard Deviation: {std_dev_val}")
+        vals = {key: format_metric(metrics.get(key), (int, float, Decimal))
+                for key in ('min', 'max', 'avg', 'median', 'std_dev')}
+        st.write(f"- Min Value: {vals['min']}")
+        st.write(f"- Max Value: {vals['max']}")
+        st.write(f"- Average: {vals['avg']}")
+        st.write(f"- Median: {vals['median']}")
+        st.write(f"- Standard Deviation: {vals['std_dev']}")
     elif data_type in ['varchar', 'nvarchar', 'char', 'nchar', 'text', 'ntext']:
         st.write("**Text Statistics:**")
-        min_length = metrics.get('min_length', 'N/A')
-        max_length = metrics.get('max_length', 'N/A')
-        avg_length = metrics.get('avg_length', 'N/A')
-        if isinstance(min_length, (float, Decimal)):
-            min_length = f"{min_length:.2f}"
-        if isinstance(max_length, (float, Decimal)):
-            max_length = f"{max_length:.2f}"
-        if isinstance(avg_length, (float, Decimal)):
-            avg_length = f"{avg_length:.2f}"
-        st.write(f"- Min Length: {min_length}")
-        st.write(f"- Max Length: {max_length}")
-        st.write(f"- Average Length: {avg_length}")
+        vals = {key: format_metric(metrics.get(key)) for key in ('min_length', 'max_length', 'avg_length')}
+        st.write(f"- Min Length: {vals['min_length']}")
+        st.write(f"- Max Length: {vals['max_length']}")
+        st.write(f"- Average Length: {vals['avg_length']}")
     elif data_type in ['date', 'datetime', 'datetime2', 'smalldatetime']:
         st.write("**Date Statistics:**")
         st.write(f"- Min Date: {metrics.get('min_date', 'N/A')}")
@@ -374,64 +542,80 @@ def col_analysis(connector, schema, table, col_info):
 import pandas as pd
 import numpy as np
 
-def height_balanced_histogram(series, n_buckets=10):
-    series = series.dropna()
-    if series.nunique() == 1:
-        return [series.min(), series.max()], [len(series)], [f"{series.min()}"]
-
-    try:
-        buckets, bin_edges = pd.qcut(series, q=n_buckets, retbins=True, duplicates='raise')
-        counts = buckets.value_counts(sort=False).values
-        labels = [f"{bin_edges[i]:.2f} - {bin_edges[i+1]:.2f}" for i in range(len(bin_edges)-1)]
-        return bin_edges, counts, labels
-    except ValueError as e:
-        buckets, bin_edges = pd.qcut(series, q=n_buckets, retbins=True, duplicates='drop')
-        counts = buckets.value_counts(sort=False).values
-
-        bin_edges = np.array(bin_edges)
-        unique_edges = [bin_edges[0]]
-        merged_counts = []
-        labels = []
-
-        current_count = counts[0]
-        for i in range(1, len(counts)):
-            if bin_edges[i] == bin_edges[i + 1]:
-                current_count += counts[i]
-            else:
-                unique_edges.append(bin_edges[i])
-                merged_counts.append(current_count)
-                labels.append(f"{unique_edges[-2]:.2f} - {unique_edges[-1]:.2f}")
-                current_count = counts[i]
-        unique_edges.append(bin_edges[-1])
-        merged_counts.append(current_count)
-        labels.append(f"{unique_edges[-2]:.2f} - {unique_edges[-1]:.2f}")
-
-        return unique_edges, merged_counts, labels
-
+def height_balanced_histogram(values, n_buckets=10):
+    values = np.asarray(values, dtype=np.float64)
+    values = np.sort(values[~np.isnan(values)])
+    if values[0] == values[-1]:
+        return [values[0], values[-1]], [len(values)], [f"{values[0]}"]
+
+    # Quantile edges, with duplicates from skewed data merged away
+    bin_edges = np.unique(np.quantile(values, np.linspace(0, 1, n_buckets + 1)))
+    # Buckets are right-closed like pd.qcut, the first one also holding the minimum;
+    # on sorted data one binary search per edge counts them without binning each value
+    positions = np.searchsorted(values, bin_edges, side='right')
+    counts = np.diff(positions)
+    counts[0] += positions[0]
+    edge_text = np.char.mod('%.2f', bin_edges)
+    labels = np.char.add(np.char.add(edge_text[:-1], ' - '), edge_text[1:]).tolist()
+    return bin_edges, counts, labels
+
+
+def box_stats_from_counts(value_counts, max_outliers=100):
+    """Get box plot statistics, as get_box_stats returns them, from (value, count) rows.
+
+    Each value is weighted by its count; returns () when there are no non-null values.
+    The result describes only the values passed in, e.g. the top values of get_value_counts.
+    """
+    rows = np.array([(row[0], row[1]) for row in value_counts], dtype=np.float64)
+    rows = rows[~np.isnan(rows[:, 0])]
+    if not rows.size:
+        return ()
+    values, counts = rows[:, 0], rows[:, 1]
+    q1, median, q3 = np.percentile(values, [25, 50, 75], weights=counts, method='inverted_cdf')
+    lo, hi = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    inside = (values >= lo) & (values <= hi)
+    outliers = values[~inside][:max_outliers]
+    return (float(values[inside].min()), float(q1), float(median), float(q3), float(values[inside].max()),
+            outliers.tolist())
+
+
+# Helper for naming the SQL dialect of a connector
+def sql_dialect(connector):
+    name = connector.__class__.__name__.lower()
+    if 'postgres' in name:
+        return 'postgresql'
+    elif 'mssql' in name:
+        return 'mssql'
+    elif 'oracle' in name:
+        return 'oracle'
+    else:
+        return 'mysql'
 
+# Identifier quoting per SQL dialect; unknown dialects leave names unquoted
+IDENTIFIER_FORMATS = {
+    'mysql': '`{}`',
+    'postgresql': '"{}"',
+    'mssql': '[{}]',
+    'oracle': '"{}"',
+}
 
 # Helper for quoting SQL identifiers (column/table names)
 def sql_quote_identifier(identifier, dbtype):
-    if dbtype == 'mysql':
-        return f'`{identifier}`'
-    elif dbtype == 'postgresql':
-        return f'"{identifier}"'
-    elif dbtype == 'mssql':
-        return f'[{identifier}]'
-    elif dbtype == 'oracle':
-        return f'"{identifier}"'
-    else:
-        return identifier
+    return IDENTIFIER_FORMATS.get(dbtype, '{}').format(identifier)
 
 # Helper for quoting full table name
 def sql_quote_table(schema, table, dbtype):
+    return f'{sql_quote_identifier(schema, dbtype)}.{sql_quote_identifier(table, dbtype)}'
+
+# Helper for casting a numeric expression to a double precision float
+def sql_cast_float(expr, dbtype):
     if dbtype == 'mysql':
-        return f'`{schema}`.`{table}`'
+        return f'CAST({expr} AS DOUBLE)'
     elif dbtype == 'postgresql':
-        return f'"{schema}"."{table}"'
+        return f'CAST({expr} AS DOUBLE PRECISION)'
     elif dbtype == 'mssql':
-        return f'[{schema}].[{table}]'
+        return f'CAST({expr} AS FLOAT)'
     elif dbtype == 'oracle':
-        return f'"{schema}"."{table}"'
+        return f'CAST({expr} AS BINARY_DOUBLE)'
     else:
-        return f'{schema}.{table}'
+        return expr
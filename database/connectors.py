@@ -1,16 +1,60 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import time
 import psycopg2
+from psycopg2 import pool, sql
 import pyodbc
 import mysql.connector
 import oracledb
 import pandas as pd
+from database.pool import get_pool
 
 class DatabaseConnector(ABC):
     """Abstract base class for database connectors"""
-    
+
+    # Whether worker() hands out independent connections usable from other threads
+    supports_concurrent_queries = False
+
+    # When False, connectors may trade exact distinct counts for faster estimates
+    exact_counts = True
+    # Tables estimated at or below this many rows are always counted exactly
+    ESTIMATE_MIN_ROWS = 1_000_000
+
+    # Percentage of the table profiling queries read; below 100 results are estimates
+    sample_percent = 100
+    supports_sampling = False
+
     def __init__(self):
         self.connection = None
         self.cursor = None
+        self.cache_key = None
+
+    def _scale_count(self, count):
+        """Scale a count taken over the sampled rows up to the whole table"""
+        if self.sample_percent >= 100 or count is None:
+            return count
+        return round(count * 100 / self.sample_percent)
+
+    def _estimate_distinct(self, distinct, singletons, doubletons, non_null):
+        """Estimate the distinct count of the whole table from sample frequencies (Chao1)"""
+        if self.sample_percent >= 100 or not non_null:
+            # Nothing to extrapolate from when the sample holds no values
+            return distinct
+        if doubletons:
+            estimate = distinct + singletons * singletons / (2 * doubletons)
+        else:
+            estimate = distinct + singletons * (singletons - 1) / 2
+        return min(round(estimate), self._scale_count(non_null))
+
+    def _make_cache_key(self, config):
+        """Build a hashable identity of the target database for keying cached lookups"""
+        return (
+            self.__class__.__name__,
+            config.get('host'),
+            config.get('port'),
+            config.get('dbname') or config.get('database'),
+            config.get('user'),
+        )
     
     @abstractmethod
     def connect(self, config):
@@ -42,6 +86,84 @@ class DatabaseConnector(ABC):
         """Get detailed column analysis"""
         pass
 
+    def get_table_column_details(self, schema, table_name, columns):
+        """Get detailed analysis for every column of a table, keyed by column name.
+
+        Connectors that can compute all columns in one pass override this;
+        the default falls back to one get_column_details call per column.
+        """
+        return {col[0]: self.get_column_details(schema, table_name, col[0]) for col in columns}
+
+    # Columns per statement in the single-statement get_table_column_details implementations,
+    # keeping select lists under every dialect's limit (Oracle allows 1000 expressions)
+    COLUMN_DETAILS_BATCH_SIZE = 100
+
+    def _column_details_in_batches(self, schema, table_name, columns, fetch_batch):
+        """Run fetch_batch over slices of columns and merge the per-column details"""
+        details = {}
+        for start in range(0, len(columns), self.COLUMN_DETAILS_BATCH_SIZE):
+            details.update(fetch_batch(schema, table_name, columns[start:start + self.COLUMN_DETAILS_BATCH_SIZE]))
+        return details
+
+    def get_freshness_tag(self, schema, table_name):
+        """Get a cheap value that changes whenever the table's data changes.
+
+        Returns None when the connector cannot tell, in which case results
+        for the table should not be cached.
+        """
+        return None
+
+    # Longest a tag built from lagging catalog statistics keeps a cached result alive
+    FRESHNESS_WINDOW_SECONDS = 60
+
+    def _freshness_window(self):
+        """Number the current FRESHNESS_WINDOW_SECONDS window, so lagging tags still expire"""
+        return int(time.time() // self.FRESHNESS_WINDOW_SECONDS)
+
+    def get_histogram(self, schema, table, column, n_buckets=10):
+        """Get a height-balanced histogram of a numeric column as (low, high, count) rows.
+
+        Returns None when the connector cannot bin server-side, in which case
+        callers fall back to binning the raw values themselves.
+        """
+        return None
+
+    def get_box_stats(self, schema, table, column, max_outliers=100):
+        """Get (lower whisker, q1, median, q3, upper whisker, outliers) of a numeric column.
+
+        Whiskers follow the 1.5 * IQR rule and outliers holds at most
+        max_outliers of the values beyond them. Returns None if unsupported.
+        """
+        return None
+
+    def get_numeric_profile(self, schema, table, column, n_buckets=10, max_outliers=100):
+        """Get (histogram, box stats) of a numeric column, as get_histogram and get_box_stats return them.
+
+        Connectors that can compute both in one round trip override this.
+        """
+        return (self.get_histogram(schema, table, column, n_buckets),
+                self.get_box_stats(schema, table, column, max_outliers))
+
+    def get_top_values(self, schema, table, column, n=9):
+        """Get the n most frequent values of a column and what the rest add up to.
+
+        Returns (rows, others_count, others_distinct) where rows are
+        (value, count) pairs, or None if the connector cannot compute it in
+        one query, in which case callers fall back to get_value_counts.
+        """
+        return None
+
+    @contextmanager
+    def worker(self):
+        """Yield a connector for running queries off the main thread.
+
+        Connectors without a pool yield themselves; check
+        supports_concurrent_queries before fanning work out to threads.
+        Yields None when no spare connection is free, in which case the
+        caller should run the work on the main thread instead.
+        """
+        yield self
+
     @abstractmethod
     def get_primary_keys(self, schema, table_name):
         """Return a list of primary key column names for the table"""
@@ -74,17 +196,43 @@ class DatabaseConnector(ABC):
 
 class PostgresConnector(DatabaseConnector):
     """PostgreSQL database connector"""
-    
+
+    NUMERIC_TYPES = ('integer', 'bigint', 'smallint', 'numeric', 'real', 'double precision')
+    TEXT_TYPES = ('character varying', 'character', 'text')
+    DATE_TYPES = ('date', 'timestamp', 'timestamp with time zone')
+    # Types without an equality operator, which cannot be grouped or counted distinct
+    UNGROUPABLE_TYPES = ('json', 'xml', 'point', 'line', 'lseg', 'box', 'path', 'polygon', 'circle')
+
+    supports_concurrent_queries = True
+    supports_sampling = True
+
+    # Whether the connection was borrowed from the shared pool rather than opened directly
+    pooled = False
+
     def connect(self, config):
-        """Connect to PostgreSQL database"""
+        """Connect to PostgreSQL database using a connection from the shared pool"""
         try:
-            self.connection = psycopg2.connect(**config)
+            self.pool = get_pool('postgres', **config)
+            # A reconnect hands the broken connection back to be discarded
+            if getattr(self, 'connection', None):
+                self._release_connection(discard=True)
+            try:
+                self.connection = self.pool.getconn()
+                self.pooled = True
+                if self.connection.closed:
+                    self.pool.putconn(self.connection, close=True)
+                    self.connection = self.pool.getconn()
+            except pool.PoolError:
+                # Other sessions hold every pooled connection: open one of our own
+                self.connection = psycopg2.connect(**config)
+                self.pooled = False
             self.cursor = self.connection.cursor()
+            self.cache_key = self._make_cache_key(config)
         except Exception as e:
             raise Exception(f"Error connecting to PostgreSQL: {str(e)}")
-    
+
     def close(self):
-        """Close PostgreSQL connection safely"""
+        """Return the PostgreSQL connection to the pool safely"""
         try:
             if hasattr(self, 'cursor') and self.cursor:
                 self.cursor.close()
@@ -93,10 +241,42 @@ class PostgresConnector(DatabaseConnector):
 
         try:
             if hasattr(self, 'connection') and self.connection:
-                self.connection.close()
+                # Reset the session before the next rerun borrows it
+                if not self.connection.closed:
+                    self.connection.rollback()
+                self._release_connection()
         except Exception as e:
             logger.warning(f"PostgreSQL connection close error: {e}")
 
+    def _release_connection(self, discard=False):
+        """Hand the connection back to the pool, or close it if it was opened directly"""
+        if self.pooled:
+            self.pool.putconn(self.connection, close=discard or bool(self.connection.closed))
+        else:
+            self.connection.close()
+        self.connection = None
+
+    @contextmanager
+    def worker(self):
+        """Yield a connector on its own pooled connection for use from another thread, or None if the pool is exhausted"""
+        worker = PostgresConnector()
+        worker.pool = self.pool
+        worker.cache_key = self.cache_key
+        worker.exact_counts = self.exact_counts
+        worker.sample_percent = self.sample_percent
+        try:
+            worker.connection = self.pool.getconn()
+            worker.pooled = True
+        except pool.PoolError:
+            # Never share the main connection: it is returned to the pool when the page ends
+            yield None
+            return
+        worker.cursor = worker.connection.cursor()
+        try:
+            yield worker
+        finally:
+            worker.close()
+
     def ensure_connected(self, config: dict):
         try:
             self.cursor.execute("SELECT 1")
@@ -106,15 +286,19 @@ class PostgresConnector(DatabaseConnector):
 
     
     def get_all_tables_and_views(self, schema):
-
-        try:
-            self.cursor.execute(f"""
-                SELECT table_name, table_type 
-                FROM information_schema.tables 
-                WHERE table_schema = '{schema}'
-                AND table_type IN ('BASE TABLE', 'VIEW')
-                ORDER BY table_name
-            """)
+        """Get all tables and views in the schema from pg_class"""
+        try:
+            # pg_class avoids the many catalog joins behind information_schema.tables
+            self.cursor.execute("""
+                SELECT c.relname AS table_name,
+                       CASE WHEN c.relkind = 'v' THEN 'VIEW' ELSE 'BASE TABLE' END AS table_type
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s
+                  AND c.relkind IN ('r', 'p', 'v')
+                  AND has_table_privilege(c.oid, 'SELECT')
+                ORDER BY c.relname
+            """, (schema,))
             return self.cursor.fetchall()
         except Exception as e:
             raise Exception(f"Error getting tables and views: {str(e)}")
@@ -122,17 +306,25 @@ class PostgresConnector(DatabaseConnector):
     def get_table_analysis(self, schema, table_name):
 
         try:
+            # The planner's row estimate saves a full scan of a large table
+            row_estimate = self._large_table_estimate(schema, table_name)
+            table_ref = self._ident(schema, table_name)
+            if row_estimate is None:
+                counted = f'SELECT COUNT(*) AS n FROM {table_ref}'
+            else:
+                counted = f'SELECT {int(row_estimate)}::bigint AS n'
             self.cursor.execute(f"""
+                WITH counted AS ({counted})
                 SELECT 
-                    COUNT(*) as row_count,
-                    pg_total_relation_size('"{schema}"."{table_name}"') / 1024.0 / 1024.0 as total_size_mb,
-                    pg_relation_size('"{schema}"."{table_name}"') / 1024.0 / 1024.0 as table_size_mb,
-                    (pg_total_relation_size('"{schema}"."{table_name}"') - pg_relation_size('"{schema}"."{table_name}"')) / 1024.0 / 1024.0 as index_size_mb,
-                    pg_relation_size('"{schema}"."{table_name}"') as total_size_bytes,
-                    pg_relation_size('"{schema}"."{table_name}"') / NULLIF(COUNT(*), 0) as avg_row_width,
+                    n as row_count,
+                    pg_total_relation_size(%(rel)s) / 1024.0 / 1024.0 as total_size_mb,
+                    pg_relation_size(%(rel)s) / 1024.0 / 1024.0 as table_size_mb,
+                    (pg_total_relation_size(%(rel)s) - pg_relation_size(%(rel)s)) / 1024.0 / 1024.0 as index_size_mb,
+                    pg_relation_size(%(rel)s) as total_size_bytes,
+                    pg_relation_size(%(rel)s) / NULLIF(n, 0) as avg_row_width,
                     NULL as last_analyzed
-                FROM "{schema}"."{table_name}"
-            """)
+                FROM counted
+            """, {'rel': table_ref})
             
             result = self.cursor.fetchone()
 
@@ -199,88 +391,250 @@ class PostgresConnector(DatabaseConnector):
                 AND column_name = %s
             ''', (schema, table_name, column_name))
             data_type = self.cursor.fetchone()[0].lower()
+            col = self._ident(column_name)
+            table_ref = self._ident(schema, table_name)
+
+            # Type-specific metrics, computed in the same statement as the counts
+            if data_type in self.NUMERIC_TYPES:
+                metric_names = ('min', 'max', 'avg', 'std_dev', 'median')
+                metric_exprs = [
+                    f'MIN({col})',
+                    f'MAX({col})',
+                    f'AVG({col})::float8',
+                    f'STDDEV({col})::float8',
+                    f'PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY {col})',
+                ]
+            elif data_type in self.TEXT_TYPES:
+                metric_names = ('min_length', 'max_length', 'avg_length')
+                metric_exprs = [f'MIN(LENGTH({col}))', f'MAX(LENGTH({col}))', f'AVG(LENGTH({col}))::float8']
+            elif data_type in self.DATE_TYPES:
+                metric_names = ('min_date', 'max_date')
+                metric_exprs = [f'MIN({col})', f'MAX({col})']
+            else:
+                metric_names, metric_exprs = (), ['NULL']
 
-            # Common metrics for all types
-            base_query = f'''
-                SELECT 
-                    COUNT(DISTINCT "{column_name}") as distinct_count,
-                    SUM(CASE WHEN "{column_name}" IS NULL THEN 1 ELSE 0 END) as null_count
-                FROM "{schema}"."{table_name}"
+            # One GROUP BY yields distinct, unique and null counts together
+            query = f'''
+                WITH grouped AS (
+                    SELECT {col} AS v, COUNT(*) AS cnt
+                    FROM {table_ref}
+                    GROUP BY {col}
+                ),
+                counts AS (
+                    SELECT COUNT(v) AS distinct_count,
+                           COUNT(*) FILTER (WHERE cnt = 1) AS unique_count,
+                           COALESCE(SUM(cnt) FILTER (WHERE v IS NULL), 0)::bigint AS null_count
+                    FROM grouped
+                ),
+                metrics AS (
+                    SELECT {", ".join(metric_exprs)}
+                    FROM {table_ref}
+                )
+                SELECT * FROM counts CROSS JOIN metrics
             '''
-            self.cursor.execute(base_query)
-            counts = self.cursor.fetchone()
+            self.cursor.execute(query)
+            row = self.cursor.fetchone()
+            return {
+                'data_type': data_type,
+                'distinct_count': row[0],
+                'null_count': row[2],
+                'unique_count': row[1],
+                'metrics': dict(zip(metric_names, row[3:]))
+            }
+        except Exception as e:
+            raise Exception(f"Error getting column details: {str(e)}")
 
-            # Get unique count
-            unique_count_query = f'''
-                SELECT COUNT(*) FROM (
-                    SELECT "{column_name}"
-                    FROM "{schema}"."{table_name}"
-                    GROUP BY "{column_name}"
-                    HAVING COUNT(*) = 1
-                ) AS unique_values
-            '''
-            self.cursor.execute(unique_count_query)
-            unique_count = self.cursor.fetchone()[0]
+    def _ident(self, *names):
+        """Quote a (possibly schema-qualified) identifier for use in SQL text"""
+        return sql.Identifier(*names).as_string(self.connection)
+
+    def _table_ref(self, schema, table):
+        """Quote a table name, adding a repeatable TABLESAMPLE clause when sampling"""
+        table_ref = self._ident(schema, table)
+        if self.sample_percent >= 100:
+            return table_ref
+        return f'{table_ref} TABLESAMPLE SYSTEM ({float(self.sample_percent)}) REPEATABLE (42)'
+
+    def _large_table_estimate(self, schema, table_name):
+        """Get the planner's row estimate when estimates are allowed and the table is large, else None"""
+        if self.exact_counts:
+            return None
+        # reltuples is -1 (or 0) until the table is analyzed
+        self.cursor.execute("""
+            SELECT c.reltuples::bigint
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s AND c.relname = %s AND c.relkind IN ('r', 'p')
+        """, (schema, table_name))
+        estimate = self.cursor.fetchone()
+        if estimate and estimate[0] > self.ESTIMATE_MIN_ROWS:
+            return estimate[0]
+        return None
+
+    def has_extension(self, name):
+        """Check whether a PostgreSQL extension is installed in the current database"""
+        if getattr(self, '_extensions', None) is None:
+            self.cursor.execute("SELECT extname FROM pg_catalog.pg_extension")
+            self._extensions = {row[0] for row in self.cursor.fetchall()}
+        return name in self._extensions
+
+    def get_freshness_tag(self, schema, table_name):
+        """Get the relation size and modification counters of a PostgreSQL table.
+
+        Partitioned parents have no tag: their writes are counted on the partitions.
+        """
+        try:
+            self.cursor.execute("""
+                SELECT pg_relation_size(c.oid), s.n_tup_ins, s.n_tup_upd, s.n_tup_del, s.n_live_tup
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_catalog.pg_stat_all_tables s ON s.relid = c.oid
+                WHERE n.nspname = %s AND c.relname = %s AND c.relkind <> 'p'
+            """, (schema, table_name))
+            result = self.cursor.fetchone()
+            return tuple(result) if result else None
+        except Exception as e:
+            raise Exception(f"Error getting table freshness: {str(e)}")
 
-            metrics = {}
-            if data_type in ['integer', 'bigint', 'smallint', 'numeric', 'real', 'double precision']:
-                # Numeric type metrics (including median)
+    def get_table_column_details(self, schema, table_name, columns):
+        """Get detailed analysis for all columns of a PostgreSQL table, one statement per batch of columns"""
+        return self._column_details_in_batches(schema, table_name, list(columns), self._get_column_details_batch)
+
+    def _get_column_details_batch(self, schema, table_name, columns):
+        """Get detailed analysis for a batch of columns of a PostgreSQL table in a single statement.
+
+        Per-column aggregates share one scan of the table, and distinct/unique
+        counts come from one GROUPING SETS pass instead of a GROUP BY per column.
+        Unless exact_counts is set, distinct counts of tables over
+        ESTIMATE_MIN_ROWS are estimated with the hll extension when it is installed; the grouping pass and unique counts
+        are then skipped. Medians likewise come from the tdigest extension
+        when it is installed. When sampling, counts are scaled up to the table and
+        distinct counts are extrapolated from the sample frequencies.
+        Columns of UNGROUPABLE_TYPES get null counts only.
+        """
+        if not columns:
+            return {}
+        try:
+            sampled = self.sample_percent < 100
+            large = self._large_table_estimate(schema, table_name) is not None
+            approximate = large and not sampled and self.has_extension('hll')
+            approximate_median = large and self.has_extension('tdigest')
+            source = self._table_ref(schema, table_name)
+            aggregates = []
+            grouping = []
+            grouping_sets = []
+            value_aggregates = []
+            layout = []
+            for i, column in enumerate(columns):
+                column_name = column[0]
+                data_type = (column[1] or '').lower()
+                col = self._ident(column_name)
+                aggregates.append(f'COUNT(*) - COUNT({col})')
+                if data_type in self.NUMERIC_TYPES:
+                    kind = 'numeric'
+                    if approximate_median:
+                        median = f'tdigest_percentile({col}::float8, 100, 0.5)'
+                    else:
+                        median = f'PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY {col})'
+                    aggregates.extend([
+                        f'MIN({col})',
+                        f'MAX({col})',
+                        f'AVG({col})::float8',
+                        f'STDDEV({col})::float8',
+                        median,
+                    ])
+                elif data_type in self.TEXT_TYPES:
+                    kind = 'text'
+                    aggregates.extend([
+                        f'MIN(LENGTH({col}))',
+                        f'MAX(LENGTH({col}))',
+                        f'AVG(LENGTH({col}))::float8',
+                    ])
+                elif data_type in self.DATE_TYPES:
+                    kind = 'date'
+                    aggregates.extend([f'MIN({col})', f'MAX({col})'])
+                else:
+                    kind = None
+                groupable = data_type not in self.UNGROUPABLE_TYPES
+                layout.append((column_name, data_type, kind, groupable))
+                if not groupable:
+                    continue
+                if approximate:
+                    value_aggregates.append(f'hll_cardinality(hll_add_agg(hll_hash_any({col})))::bigint')
+                    continue
+                grouping.append(f'GROUPING({col}) AS g_{i}, {col} AS v_{i}')
+                grouping_sets.append(f'({col})')
+                value_aggregates.append(f'COUNT(*) FILTER (WHERE g_{i} = 0 AND v_{i} IS NOT NULL)')
+                if sampled:
+                    # Chao1 frequencies cover real values only, never the NULL group
+                    value_aggregates.append(f'COUNT(*) FILTER (WHERE g_{i} = 0 AND v_{i} IS NOT NULL AND cnt = 1)')
+                    value_aggregates.append(f'COUNT(*) FILTER (WHERE g_{i} = 0 AND v_{i} IS NOT NULL AND cnt = 2)')
+                    value_aggregates.append(f'COALESCE(SUM(cnt) FILTER (WHERE g_{i} = 0 AND v_{i} IS NOT NULL), 0)')
+                else:
+                    value_aggregates.append(f'COUNT(*) FILTER (WHERE g_{i} = 0 AND cnt = 1)')
+
+            if approximate or not grouping:
                 query = f'''
-                    SELECT 
-                        MIN("{column_name}") as min_value,
-                        MAX("{column_name}") as max_value,
-                        AVG("{column_name}") as avg_value,
-                        STDDEV("{column_name}") as std_dev,
-                        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY "{column_name}") as median_value
-                    FROM "{schema}"."{table_name}"
+                    SELECT {", ".join(aggregates + value_aggregates)}
+                    FROM {source}
                 '''
-                self.cursor.execute(query)
-                min_value, max_value, avg_value, std_dev, median_value = self.cursor.fetchone()
-                metrics.update({
-                    'min': min_value,
-                    'max': max_value,
-                    'avg': avg_value,
-                    'std_dev': std_dev,
-                    'median': median_value
-                })
-            elif data_type in ['character varying', 'character', 'text']:
-                # String type metrics
-                query = f'''
-                    SELECT 
-                        MIN(LENGTH("{column_name}")) as min_length,
-                        MAX(LENGTH("{column_name}")) as max_length,
-                        AVG(LENGTH("{column_name}")) as avg_length
-                    FROM "{schema}"."{table_name}"
-                    WHERE "{column_name}" IS NOT NULL
-                '''
-                self.cursor.execute(query)
-                min_length, max_length, avg_length = self.cursor.fetchone()
-                metrics.update({
-                    'min_length': min_length,
-                    'max_length': max_length,
-                    'avg_length': avg_length
-                })
-            elif data_type in ['date', 'timestamp', 'timestamp with time zone']:
-                # Date type metrics
+            else:
                 query = f'''
-                    SELECT 
-                        MIN("{column_name}") as min_value,
-                        MAX("{column_name}") as max_value
-                    FROM "{schema}"."{table_name}"
+                    WITH stats AS (
+                        SELECT {", ".join(aggregates)}
+                        FROM {source}
+                    ),
+                    grouped AS (
+                        SELECT {", ".join(grouping)}, COUNT(*) AS cnt
+                        FROM {source}
+                        GROUP BY GROUPING SETS ({", ".join(grouping_sets)})
+                    ),
+                    value_stats AS (
+                        SELECT {", ".join(value_aggregates)}
+                        FROM grouped
+                    )
+                    SELECT * FROM stats CROSS JOIN value_stats
                 '''
-                self.cursor.execute(query)
-                min_value, max_value = self.cursor.fetchone()
-                metrics.update({
-                    'min_date': min_value,
-                    'max_date': max_value
-                })
-            return {
-                'data_type': data_type,
-                'distinct_count': counts[0] if counts else 0,
-                'null_count': counts[1] if counts else 0,
-                'unique_count': unique_count,
-                'metrics': metrics
-            }
+            self.cursor.execute(query)
+            row = self.cursor.fetchone()
+
+            details = {}
+            pos = 0
+            value_pos = len(aggregates)
+            for column_name, data_type, kind, groupable in layout:
+                null_count = row[pos]
+                pos += 1
+                metrics = {}
+                if kind == 'numeric':
+                    metrics = dict(zip(('min', 'max', 'avg', 'std_dev', 'median'), row[pos:pos + 5]))
+                    pos += 5
+                elif kind == 'text':
+                    metrics = dict(zip(('min_length', 'max_length', 'avg_length'), row[pos:pos + 3]))
+                    pos += 3
+                elif kind == 'date':
+                    metrics = dict(zip(('min_date', 'max_date'), row[pos:pos + 2]))
+                    pos += 2
+                if not groupable:
+                    distinct_count = unique_count = None
+                elif approximate:
+                    distinct_count, unique_count = row[value_pos], None
+                    value_pos += 1
+                elif sampled:
+                    # Values unique in the sample need not be unique in the table
+                    distinct_count = self._estimate_distinct(*row[value_pos:value_pos + 4])
+                    unique_count = None
+                    value_pos += 4
+                else:
+                    distinct_count, unique_count = row[value_pos:value_pos + 2]
+                    value_pos += 2
+                details[column_name] = {
+                    'data_type': data_type,
+                    'distinct_count': distinct_count,
+                    'null_count': self._scale_count(null_count),
+                    'unique_count': unique_count,
+                    'metrics': metrics
+                }
+            return details
         except Exception as e:
             raise Exception(f"Error getting column details: {str(e)}")
 
@@ -316,7 +670,8 @@ class PostgresConnector(DatabaseConnector):
     def get_sample_data(self, schema: str, table: str, limit: int = 100) -> list:
         """Get sample data from a PostgreSQL table"""
         try:
-            query = f'SELECT * FROM "{schema}"."{table}" LIMIT %s'
+            table_ref = self._ident(schema, table)
+            query = f'SELECT * FROM {table_ref} LIMIT %s'
             self.cursor.execute(query, (limit,))
             return self.cursor.fetchall()
         except Exception as e:
@@ -325,11 +680,13 @@ class PostgresConnector(DatabaseConnector):
     def get_value_counts(self, schema: str, table: str, column: str, limit: int = 100) -> list:
         """Get value counts for a column in PostgreSQL"""
         try:
+            col = self._ident(column)
+            table_ref = self._ident(schema, table)
             query = f'''
-                SELECT "{column}", COUNT(*) as count
-                FROM "{schema}"."{table}"
-                WHERE "{column}" IS NOT NULL
-                GROUP BY "{column}"
+                SELECT {col}, COUNT(*) as count
+                FROM {table_ref}
+                WHERE {col} IS NOT NULL
+                GROUP BY {col}
                 ORDER BY count DESC
                 LIMIT %s
             '''
@@ -337,7 +694,147 @@ class PostgresConnector(DatabaseConnector):
             return self.cursor.fetchall()
         except Exception as e:
             raise Exception(f"Error getting value counts: {str(e)}")
-        
+
+    def get_histogram(self, schema, table, column, n_buckets=10):
+        """Get a height-balanced histogram of a numeric column, binned in PostgreSQL"""
+        try:
+            col = self._ident(column)
+            source = self._table_ref(schema, table)
+            fractions = [i / n_buckets for i in range(n_buckets + 1)]
+            query = f'''
+                WITH edges AS (
+                    SELECT PERCENTILE_CONT(%s::float8[]) WITHIN GROUP (ORDER BY {col}) AS e
+                    FROM {source}
+                ),
+                buckets AS (
+                    SELECT LEAST(width_bucket({col}::float8, edges.e), %s) AS b, COUNT(*) AS n
+                    FROM {source}, edges
+                    WHERE {col} IS NOT NULL
+                    GROUP BY 1
+                )
+                SELECT edges.e[b], edges.e[b + 1], n
+                FROM buckets, edges
+                ORDER BY b
+            '''
+            self.cursor.execute(query, (fractions, n_buckets))
+            return [(low, high, self._scale_count(n)) for low, high, n in self.cursor.fetchall()]
+        except Exception as e:
+            raise Exception(f"Error getting histogram: {str(e)}")
+
+    def get_box_stats(self, schema, table, column, max_outliers=100):
+        """Get box plot statistics of a numeric column in PostgreSQL, with a sample of outliers"""
+        try:
+            col = self._ident(column)
+            source = self._table_ref(schema, table)
+            query = f'''
+                WITH quartiles AS (
+                    SELECT PERCENTILE_CONT(ARRAY[0.25, 0.5, 0.75]) WITHIN GROUP (ORDER BY {col}) AS p
+                    FROM {source}
+                ),
+                fences AS (
+                    SELECT p, p[1] - 1.5 * (p[3] - p[1]) AS lo, p[3] + 1.5 * (p[3] - p[1]) AS hi
+                    FROM quartiles
+                )
+                SELECT fences.p,
+                       MIN({col}::float8) FILTER (WHERE {col} >= fences.lo),
+                       MAX({col}::float8) FILTER (WHERE {col} <= fences.hi),
+                       ARRAY(
+                           SELECT {col}::float8
+                           FROM {source}
+                           WHERE {col} < fences.lo OR {col} > fences.hi
+                           LIMIT %s
+                       )
+                FROM {source} CROSS JOIN fences
+                GROUP BY fences.p, fences.lo, fences.hi
+            '''
+            self.cursor.execute(query, (max_outliers,))
+            result = self.cursor.fetchone()
+            if not result or result[0] is None:
+                return ()
+            (q1, median, q3), low, high, outliers = result
+            return low, q1, median, q3, high, outliers
+        except Exception as e:
+            raise Exception(f"Error getting box plot statistics: {str(e)}")
+
+    def get_numeric_profile(self, schema, table, column, n_buckets=10, max_outliers=100):
+        """Get the histogram and box plot statistics of a numeric column in one PostgreSQL query"""
+        try:
+            col = self._ident(column)
+            source = self._table_ref(schema, table)
+            fractions = [i / n_buckets for i in range(n_buckets + 1)]
+            query = f'''
+                WITH percentiles AS (
+                    SELECT PERCENTILE_CONT(%s::float8[]) WITHIN GROUP (ORDER BY {col}) AS e,
+                           PERCENTILE_CONT(ARRAY[0.25, 0.5, 0.75]) WITHIN GROUP (ORDER BY {col}) AS p
+                    FROM {source}
+                ),
+                fences AS (
+                    SELECT e, p, p[1] - 1.5 * (p[3] - p[1]) AS lo, p[3] + 1.5 * (p[3] - p[1]) AS hi
+                    FROM percentiles
+                ),
+                buckets AS (
+                    SELECT LEAST(width_bucket({col}::float8, fences.e), %s) AS b, COUNT(*) AS n,
+                           MIN({col}::float8) FILTER (WHERE {col} >= fences.lo) AS low,
+                           MAX({col}::float8) FILTER (WHERE {col} <= fences.hi) AS high
+                    FROM {source}, fences
+                    WHERE {col} IS NOT NULL
+                    GROUP BY 1
+                ),
+                outliers AS (
+                    SELECT ARRAY(
+                        SELECT {col}::float8
+                        FROM {source}, fences
+                        WHERE {col} < fences.lo OR {col} > fences.hi
+                        LIMIT %s
+                    ) AS o
+                )
+                SELECT fences.e[b], fences.e[b + 1], n,
+                       fences.p, MIN(low) OVER (), MAX(high) OVER (), outliers.o
+                FROM buckets, fences, outliers
+                ORDER BY b
+            '''
+            self.cursor.execute(query, (fractions, n_buckets, max_outliers))
+            rows = self.cursor.fetchall()
+            if not rows:
+                return [], ()
+            histogram = [(low, high, self._scale_count(n)) for low, high, n, *_ in rows]
+            (q1, median, q3), low, high, outliers = rows[0][3:]
+            return histogram, (low, q1, median, q3, high, outliers)
+        except Exception as e:
+            raise Exception(f"Error getting numeric profile: {str(e)}")
+
+    def get_top_values(self, schema, table, column, n=9):
+        """Get the most frequent values of a column and an exact 'others' total in PostgreSQL"""
+        try:
+            col = self._ident(column)
+            source = self._table_ref(schema, table)
+            query = f'''
+                WITH vc AS (
+                    SELECT {col} AS v, COUNT(*) AS n
+                    FROM {source}
+                    WHERE {col} IS NOT NULL
+                    GROUP BY {col}
+                ),
+                ranked AS (
+                    SELECT v, n, ROW_NUMBER() OVER (ORDER BY n DESC) AS rn
+                    FROM vc
+                )
+                SELECT CASE WHEN rn <= %s THEN v END, SUM(n)::bigint, COUNT(*), MIN(rn) > %s
+                FROM ranked
+                GROUP BY 1
+                ORDER BY MIN(rn)
+            '''
+            self.cursor.execute(query, (n, n))
+            rows, others_count, others_distinct = [], 0, 0
+            for value, count, distinct, is_others in self.cursor.fetchall():
+                if is_others:
+                    others_count, others_distinct = self._scale_count(count), distinct
+                else:
+                    rows.append((value, self._scale_count(count)))
+            return rows, others_count, others_distinct
+        except Exception as e:
+            raise Exception(f"Error getting top values: {str(e)}")
+
     def get_null_count(self, schema, table, column):
         query = f'SELECT COUNT(*) FROM "{schema}"."{table}" WHERE "{column}" IS NULL'
         self.cursor.execute(query)
@@ -374,19 +871,6 @@ class PostgresConnector(DatabaseConnector):
         except Exception as e:
             raise Exception(f"Error fetching non-distinct violations: {str(e)}")
     
-    def get_all_tables_and_views(self, schema):
-        try:
-            self.cursor.execute(f"""
-                SELECT table_name, table_type 
-                FROM information_schema.tables 
-                WHERE table_schema = '{schema}'
-                AND table_type IN ('BASE TABLE', 'VIEW')
-                ORDER BY table_name
-            """)
-            return self.cursor.fetchall()
-        except Exception as e:
-            raise Exception(f"Error getting tables and views: {str(e)}")
-        
     def get_char_length_range(self, schema, table, column):
         try:
             self.cursor.execute(f'''
@@ -998,6 +1482,7 @@ class MSSQLConnector(DatabaseConnector):
             )
             self.connection = pyodbc.connect(connection_string)
             self.cursor = self.connection.cursor()
+            self.cache_key = self._make_cache_key(config)
         except Exception as e:
             raise Exception(f"Error connecting to MSSQL: {str(e)}")
     
@@ -1249,6 +1734,163 @@ class MSSQLConnector(DatabaseConnector):
         except Exception as e:
             raise Exception(f"Error getting column details: {str(e)}")
 
+    NUMERIC_TYPES = ('int', 'bigint', 'smallint', 'tinyint', 'decimal', 'numeric', 'float', 'double', 'real',
+                     'money', 'smallmoney')
+    TEXT_TYPES = ('varchar', 'nvarchar', 'char', 'nchar', 'text', 'ntext')
+    DATE_TYPES = ('date', 'datetime', 'datetime2', 'smalldatetime')
+    # Types SQL Server cannot group, compare or count; the bulk statement leaves them out
+    NON_COMPARABLE_TYPES = ('text', 'ntext', 'image', 'xml', 'geography', 'geometry', 'hierarchyid')
+
+    def _ident(self, *names):
+        """Quote a (possibly schema-qualified) identifier with brackets"""
+        return '.'.join('[' + name.replace(']', ']]') + ']' for name in names)
+
+    def _large_table_estimate(self, schema, table_name):
+        """Get the stored row count when estimates are allowed and the table is large, else None"""
+        if self.exact_counts:
+            return None
+        self.cursor.execute('''
+            SELECT SUM(p.rows)
+            FROM sys.partitions p
+            WHERE p.object_id = OBJECT_ID(?) AND p.index_id IN (0, 1)
+        ''', (self._ident(schema, table_name),))
+        estimate = self.cursor.fetchone()
+        if estimate and estimate[0] and estimate[0] > self.ESTIMATE_MIN_ROWS:
+            return estimate[0]
+        return None
+
+    def get_table_column_details(self, schema, table_name, columns):
+        """Get detailed analysis for all columns of an MSSQL table, one statement per batch of columns"""
+        return self._column_details_in_batches(schema, table_name, list(columns), self._get_column_details_batch)
+
+    def _get_column_details_batch(self, schema, table_name, columns):
+        """Get detailed analysis for a batch of columns of an MSSQL table in a single statement.
+
+        Per-column aggregates share one scan of the table, and distinct/unique
+        counts come from one GROUPING SETS pass instead of a GROUP BY per column.
+        Unless exact_counts is set, distinct counts of tables over
+        ESTIMATE_MIN_ROWS come from APPROX_COUNT_DISTINCT instead, and the
+        grouping pass and unique counts are skipped. Columns of
+        NON_COMPARABLE_TYPES are reported with None counts.
+        """
+        if not columns:
+            return {}
+        try:
+            table_ref = self._ident(schema, table_name)
+            approximate = self._large_table_estimate(schema, table_name) is not None
+            aggregates = []
+            grouping = []
+            grouping_sets = []
+            value_aggregates = []
+            layout = []
+            for i, column in enumerate(columns):
+                column_name = column[0]
+                data_type = (column[1] or '').lower()
+                if data_type in self.NON_COMPARABLE_TYPES:
+                    layout.append((column_name, column[1], None, False))
+                    continue
+                col = self._ident(column_name)
+                aggregates.append(f'COUNT(*) - COUNT({col})')
+                if data_type in self.NUMERIC_TYPES:
+                    kind = 'numeric'
+                    aggregates.extend([f'MIN({col})', f'MAX({col})', f'AVG({col})', f'STDEV({col})'])
+                elif data_type in self.TEXT_TYPES:
+                    kind = 'text'
+                    aggregates.extend([
+                        f'MIN(LEN({col}))',
+                        f'MAX(LEN({col}))',
+                        f'AVG(CAST(LEN({col}) AS FLOAT))',
+                    ])
+                elif data_type in self.DATE_TYPES:
+                    kind = 'date'
+                    aggregates.extend([f'MIN({col})', f'MAX({col})'])
+                else:
+                    kind = None
+                layout.append((column_name, column[1], kind, True))
+                if approximate:
+                    value_aggregates.append(f'APPROX_COUNT_DISTINCT({col})')
+                    continue
+                grouping.append(f'GROUPING({col}) AS g_{i}, {col} AS v_{i}')
+                grouping_sets.append(f'({col})')
+                value_aggregates.append(f'SUM(CASE WHEN g_{i} = 0 AND v_{i} IS NOT NULL THEN 1 ELSE 0 END)')
+                value_aggregates.append(f'SUM(CASE WHEN g_{i} = 0 AND cnt = 1 THEN 1 ELSE 0 END)')
+
+            # CTE columns must be named in T-SQL
+            stats = ", ".join(f'{expr} AS a_{i}' for i, expr in enumerate(aggregates))
+            value_stats = ", ".join(f'{expr} AS u_{i}' for i, expr in enumerate(value_aggregates))
+            if approximate:
+                query = f'''
+                    SELECT {", ".join(aggregates + value_aggregates)}
+                    FROM {table_ref}
+                '''
+            else:
+                query = f'''
+                    WITH stats AS (
+                        SELECT {stats}
+                        FROM {table_ref}
+                    ),
+                    grouped AS (
+                        SELECT {", ".join(grouping)}, COUNT(*) AS cnt
+                        FROM {table_ref}
+                        GROUP BY GROUPING SETS ({", ".join(grouping_sets)})
+                    ),
+                    value_stats AS (
+                        SELECT {value_stats}
+                        FROM grouped
+                    )
+                    SELECT * FROM stats CROSS JOIN value_stats
+                '''
+            row = ()
+            if aggregates:
+                self.cursor.execute(query)
+                row = self.cursor.fetchone()
+
+            details = {}
+            pos = 0
+            value_pos = len(aggregates)
+            for column_name, data_type, kind, measured in layout:
+                if not measured:
+                    details[column_name] = {
+                        'data_type': data_type,
+                        'distinct_count': None,
+                        'null_count': None,
+                        'unique_count': None,
+                        'metrics': {}
+                    }
+                    continue
+                null_count = row[pos]
+                pos += 1
+                metrics = {}
+                if kind == 'numeric':
+                    metrics = dict(zip(('min', 'max', 'avg', 'std_dev'), row[pos:pos + 4]))
+                    pos += 4
+                elif kind == 'text':
+                    metrics = dict(zip(('min_length', 'max_length', 'avg_length'), row[pos:pos + 3]))
+                    pos += 3
+                elif kind == 'date':
+                    min_date, max_date = row[pos:pos + 2]
+                    metrics = {
+                        'min_date': min_date.strftime('%Y-%m-%d %H:%M:%S') if min_date else None,
+                        'max_date': max_date.strftime('%Y-%m-%d %H:%M:%S') if max_date else None
+                    }
+                    pos += 2
+                if approximate:
+                    distinct_count, unique_count = row[value_pos] or 0, None
+                    value_pos += 1
+                else:
+                    distinct_count, unique_count = row[value_pos] or 0, row[value_pos + 1] or 0
+                    value_pos += 2
+                details[column_name] = {
+                    'data_type': data_type,
+                    'distinct_count': distinct_count,
+                    'null_count': null_count or 0,
+                    'unique_count': unique_count,
+                    'metrics': metrics
+                }
+            return details
+        except Exception as e:
+            raise Exception(f"Error getting column details: {str(e)}")
+
     def get_sample_data(self, schema: str, table: str, limit: int = 100) -> list:
         """Get sample data from a table"""
         try:
@@ -1274,6 +1916,123 @@ class MSSQLConnector(DatabaseConnector):
         except Exception as e:
             raise Exception(f"Error getting value counts: {str(e)}")
 
+    def get_freshness_tag(self, schema, table_name):
+        """Get the last write time and row count of an MSSQL table; views have no tag"""
+        object_name = self._ident(schema, table_name)
+        try:
+            self.cursor.execute('''
+                SELECT
+                    (SELECT MAX(last_user_update) FROM sys.dm_db_index_usage_stats
+                     WHERE database_id = DB_ID() AND object_id = OBJECT_ID(?)),
+                    (SELECT SUM(rows) FROM sys.partitions
+                     WHERE object_id = OBJECT_ID(?) AND index_id IN (0, 1))
+            ''', (object_name, object_name))
+            last_update, row_count = self.cursor.fetchone()
+            return (last_update, row_count) if row_count is not None else None
+        except pyodbc.Error:
+            pass
+        try:
+            # Without VIEW SERVER STATE only the row count is known, so the tag also expires with time
+            self.cursor.execute('''
+                SELECT SUM(rows) FROM sys.partitions
+                WHERE object_id = OBJECT_ID(?) AND index_id IN (0, 1)
+            ''', (object_name,))
+            row_count = self.cursor.fetchone()[0]
+            return (row_count, self._freshness_window()) if row_count is not None else None
+        except Exception as e:
+            raise Exception(f"Error getting table freshness: {str(e)}")
+
+    def get_histogram(self, schema, table, column, n_buckets=10):
+        """Get a height-balanced histogram of a numeric column, binned with NTILE in MSSQL"""
+        try:
+            col, table_ref = self._ident(column), self._ident(schema, table)
+            query = f'''
+                SELECT MIN({col}), MAX({col}), COUNT(*)
+                FROM (
+                    SELECT {col}, NTILE(?) OVER (ORDER BY {col}) AS b
+                    FROM {table_ref}
+                    WHERE {col} IS NOT NULL
+                ) AS tiles
+                GROUP BY b
+                ORDER BY b
+            '''
+            self.cursor.execute(query, (n_buckets,))
+            return [tuple(row) for row in self.cursor.fetchall()]
+        except Exception as e:
+            raise Exception(f"Error getting histogram: {str(e)}")
+
+    def get_box_stats(self, schema, table, column, max_outliers=100):
+        """Get box plot statistics of a numeric column in MSSQL, with a sample of outliers"""
+        try:
+            col, table_ref = self._ident(column), self._ident(schema, table)
+            value = f'CAST({col} AS FLOAT)'
+            query = f'''
+                WITH quartiles AS (
+                    SELECT TOP 1
+                        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {col}) OVER () AS q1,
+                        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY {col}) OVER () AS median,
+                        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {col}) OVER () AS q3
+                    FROM {table_ref}
+                    WHERE {col} IS NOT NULL
+                ),
+                fences AS (
+                    SELECT q1, median, q3, q1 - 1.5 * (q3 - q1) AS lo, q3 + 1.5 * (q3 - q1) AS hi
+                    FROM quartiles
+                )
+                SELECT f.q1, f.median, f.q3,
+                       MIN(CASE WHEN {value} >= f.lo THEN {value} END),
+                       MAX(CASE WHEN {value} <= f.hi THEN {value} END),
+                       f.lo, f.hi
+                FROM {table_ref} CROSS JOIN fences AS f
+                GROUP BY f.q1, f.median, f.q3, f.lo, f.hi
+            '''
+            self.cursor.execute(query)
+            row = self.cursor.fetchone()
+            if not row:
+                return ()
+            q1, median, q3, low, high, lo, hi = row
+            self.cursor.execute(f'''
+                SELECT TOP (?) {value}
+                FROM {table_ref}
+                WHERE {value} < ? OR {value} > ?
+            ''', (max_outliers, lo, hi))
+            outliers = [r[0] for r in self.cursor.fetchall()]
+            return low, q1, median, q3, high, outliers
+        except Exception as e:
+            raise Exception(f"Error getting box plot statistics: {str(e)}")
+
+    def get_top_values(self, schema, table, column, n=9):
+        """Get the most frequent values of a column and an exact 'others' total in MSSQL"""
+        try:
+            col, table_ref = self._ident(column), self._ident(schema, table)
+            query = f'''
+                SELECT v, SUM(n), COUNT(*), MIN(rn)
+                FROM (
+                    SELECT CASE WHEN rn <= {int(n)} THEN v END AS v, n, rn
+                    FROM (
+                        SELECT v, n, ROW_NUMBER() OVER (ORDER BY n DESC) AS rn
+                        FROM (
+                            SELECT {col} AS v, COUNT_BIG(*) AS n
+                            FROM {table_ref}
+                            WHERE {col} IS NOT NULL
+                            GROUP BY {col}
+                        ) AS vc
+                    ) AS ranked
+                ) AS bucketed
+                GROUP BY v
+                ORDER BY MIN(rn)
+            '''
+            self.cursor.execute(query)
+            rows, others_count, others_distinct = [], 0, 0
+            for value, count, distinct, first_rank in self.cursor.fetchall():
+                if first_rank > n:
+                    others_count, others_distinct = count, distinct
+                else:
+                    rows.append((value, count))
+            return rows, others_count, others_distinct
+        except Exception as e:
+            raise Exception(f"Error getting top values: {str(e)}")
+
     def get_primary_keys(self, schema, table_name):
         self.cursor.execute('''
             SELECT COLUMN_NAME
@@ -1924,6 +2683,7 @@ class MySQLConnector(DatabaseConnector):
             self.connection = mysql_connector.connect(**_build_kwargs(use_pure=False))
             self.connection.ping(reconnect=True, attempts=1, delay=0)
             self.cursor = self.connection.cursor(buffered=True, dictionary=False)
+            self.cache_key = self._make_cache_key(config)
             return
         except RuntimeError as e:
             if "Failed raising error" not in str(e):
@@ -1933,6 +2693,7 @@ class MySQLConnector(DatabaseConnector):
                 self.connection = mysql_connector.connect(**_build_kwargs(use_pure=True))
                 self.connection.ping(reconnect=True, attempts=1, delay=0)
                 self.cursor = self.connection.cursor(buffered=True, dictionary=False)
+                self.cache_key = self._make_cache_key(config)
                 return
             except Exception as inner:
                 tb = "".join(traceback.format_exception(type(inner), inner, inner.__traceback__))
@@ -2207,6 +2968,87 @@ class MySQLConnector(DatabaseConnector):
     
             raise Exception(f"Error getting column details: {str(e)}")    
     
+    NUMERIC_TYPES = ('int', 'bigint', 'smallint', 'tinyint', 'decimal', 'numeric', 'float', 'double')
+    TEXT_TYPES = ('varchar', 'char', 'text', 'longtext', 'mediumtext', 'tinytext')
+    DATE_TYPES = ('date', 'datetime', 'timestamp')
+
+    def _ident(self, *names):
+        """Quote a (possibly schema-qualified) identifier with backticks"""
+        return '.'.join('`' + name.replace('`', '``') + '`' for name in names)
+
+    def get_table_column_details(self, schema, table_name, columns):
+        """Get detailed analysis for all columns of a MySQL table in a single statement.
+
+        Aggregates for every column share one scan; unique counts come from a
+        COUNT(*) OVER (PARTITION BY col) per column over the same derived table.
+        """
+        if not columns:
+            return {}
+        try:
+            aggregates = []
+            partitions = []
+            layout = []
+            for i, column in enumerate(columns):
+                column_name = column[0]
+                data_type = (column[1] or '').lower()
+                col = self._ident(column_name)
+                aggregates.append(f'COUNT(*) - COUNT({col})')
+                aggregates.append(f'COUNT(DISTINCT {col})')
+                aggregates.append(f'SUM(_pn_{i} = 1)')
+                partitions.append(f'{col}, COUNT(*) OVER (PARTITION BY {col}) AS _pn_{i}')
+                if data_type in self.NUMERIC_TYPES:
+                    kind = 'numeric'
+                    aggregates.extend([f'MIN({col})', f'MAX({col})', f'AVG({col})', f'STDDEV({col})'])
+                elif data_type in self.TEXT_TYPES:
+                    kind = 'text'
+                    aggregates.extend([f'MIN(LENGTH({col}))', f'MAX(LENGTH({col}))', f'AVG(LENGTH({col}))'])
+                elif data_type in self.DATE_TYPES:
+                    kind = 'date'
+                    aggregates.extend([f'MIN({col})', f'MAX({col})'])
+                else:
+                    kind = None
+                layout.append((column_name, column[1], kind))
+
+            query = f"""
+                SELECT {", ".join(aggregates)}
+                FROM (
+                    SELECT {", ".join(partitions)}
+                    FROM {self._ident(schema, table_name)}
+                ) AS t
+            """
+            self.cursor.execute(query)
+            row = self.cursor.fetchone()
+
+            details = {}
+            pos = 0
+            for column_name, data_type, kind in layout:
+                null_count, distinct_count, unique_count = row[pos:pos + 3]
+                pos += 3
+                metrics = {}
+                if kind == 'numeric':
+                    metrics = dict(zip(('min', 'max', 'avg', 'std_dev'), row[pos:pos + 4]))
+                    pos += 4
+                elif kind == 'text':
+                    metrics = dict(zip(('min_length', 'max_length', 'avg_length'), row[pos:pos + 3]))
+                    pos += 3
+                elif kind == 'date':
+                    min_date, max_date = row[pos:pos + 2]
+                    metrics = {
+                        'min_date': min_date.strftime('%Y-%m-%d %H:%M:%S') if min_date else None,
+                        'max_date': max_date.strftime('%Y-%m-%d %H:%M:%S') if max_date else None
+                    }
+                    pos += 2
+                details[column_name] = {
+                    'data_type': data_type,
+                    'distinct_count': distinct_count or 0,
+                    'null_count': null_count or 0,
+                    'unique_count': int(unique_count or 0),
+                    'metrics': metrics
+                }
+            return details
+        except Exception as e:
+            raise Exception(f"Error getting column details: {str(e)}")
+
     def get_sample_data(self, schema: str, table: str, limit: int = 100) -> list:
         """Get sample data from a table"""
         try:
@@ -2232,6 +3074,123 @@ class MySQLConnector(DatabaseConnector):
         except Exception as e:
             raise Exception(f"Error getting value counts: {str(e)}")
 
+    def get_freshness_tag(self, schema, table_name):
+        """Get the update time and size statistics of a MySQL table.
+
+        information_schema statistics can be cached by the server, so the tag
+        also changes every FRESHNESS_WINDOW_SECONDS.
+        """
+        try:
+            self.cursor.execute("""
+                SELECT UPDATE_TIME, TABLE_ROWS, DATA_LENGTH, INDEX_LENGTH
+                FROM information_schema.tables
+                WHERE table_schema = %s AND table_name = %s AND table_type = 'BASE TABLE'
+            """, (schema, table_name))
+            result = self.cursor.fetchone()
+            return tuple(result) + (self._freshness_window(),) if result else None
+        except Exception as e:
+            raise Exception(f"Error getting table freshness: {str(e)}")
+
+    def get_histogram(self, schema, table, column, n_buckets=10):
+        """Get a height-balanced histogram of a numeric column, binned with NTILE in MySQL"""
+        try:
+            col = self._ident(column)
+            query = f"""
+                SELECT MIN({col}), MAX({col}), COUNT(*)
+                FROM (
+                    SELECT {col}, NTILE(%s) OVER (ORDER BY {col}) AS b
+                    FROM {self._ident(schema, table)}
+                    WHERE {col} IS NOT NULL
+                ) AS tiles
+                GROUP BY b
+                ORDER BY b
+            """
+            self.cursor.execute(query, (n_buckets,))
+            return self.cursor.fetchall()
+        except Exception as e:
+            raise Exception(f"Error getting histogram: {str(e)}")
+
+    def get_box_stats(self, schema, table, column, max_outliers=100):
+        """Get box plot statistics of a numeric column in MySQL, with a sample of outliers.
+
+        MySQL has no PERCENTILE_CONT, so each quartile is the first value whose
+        row number reaches that fraction of the non-null rows.
+        """
+        try:
+            col = self._ident(column)
+            table_ref = self._ident(schema, table)
+            query = f"""
+                WITH ranked AS (
+                    SELECT {col} AS v, ROW_NUMBER() OVER (ORDER BY {col}) AS rn, COUNT(*) OVER () AS n
+                    FROM {table_ref}
+                    WHERE {col} IS NOT NULL
+                ),
+                quartiles AS (
+                    SELECT MIN(CASE WHEN rn >= 0.25 * n THEN v END) AS q1,
+                           MIN(CASE WHEN rn >= 0.5 * n THEN v END) AS median,
+                           MIN(CASE WHEN rn >= 0.75 * n THEN v END) AS q3
+                    FROM ranked
+                ),
+                fences AS (
+                    SELECT q1, median, q3, q1 - 1.5 * (q3 - q1) AS lo, q3 + 1.5 * (q3 - q1) AS hi
+                    FROM quartiles
+                )
+                SELECT f.q1, f.median, f.q3,
+                       MIN(CASE WHEN r.v >= f.lo THEN r.v END),
+                       MAX(CASE WHEN r.v <= f.hi THEN r.v END),
+                       f.lo, f.hi
+                FROM ranked AS r CROSS JOIN fences AS f
+                GROUP BY f.q1, f.median, f.q3, f.lo, f.hi
+            """
+            self.cursor.execute(query)
+            row = self.cursor.fetchone()
+            if not row:
+                return ()
+            q1, median, q3, low, high, lo, hi = (float(value) for value in row)
+            self.cursor.execute(f"""
+                SELECT {col}
+                FROM {table_ref}
+                WHERE {col} < %s OR {col} > %s
+                LIMIT %s
+            """, (lo, hi, max_outliers))
+            outliers = [float(r[0]) for r in self.cursor.fetchall()]
+            return low, q1, median, q3, high, outliers
+        except Exception as e:
+            raise Exception(f"Error getting box plot statistics: {str(e)}")
+
+    def get_top_values(self, schema, table, column, n=9):
+        """Get the most frequent values of a column and an exact 'others' total in MySQL"""
+        try:
+            col = self._ident(column)
+            query = f"""
+                SELECT v, SUM(n), COUNT(*), MIN(rn)
+                FROM (
+                    SELECT CASE WHEN rn <= %s THEN v END AS v, n, rn
+                    FROM (
+                        SELECT v, n, ROW_NUMBER() OVER (ORDER BY n DESC) AS rn
+                        FROM (
+                            SELECT {col} AS v, COUNT(*) AS n
+                            FROM {self._ident(schema, table)}
+                            WHERE {col} IS NOT NULL
+                            GROUP BY {col}
+                        ) AS vc
+                    ) AS ranked
+                ) AS bucketed
+                GROUP BY v
+                ORDER BY MIN(rn)
+            """
+            self.cursor.execute(query, (n,))
+            rows, others_count, others_distinct = [], 0, 0
+            for value, count, distinct, first_rank in self.cursor.fetchall():
+                # SUM over integers comes back as Decimal
+                if first_rank > n:
+                    others_count, others_distinct = int(count), distinct
+                else:
+                    rows.append((value, int(count)))
+            return rows, others_count, others_distinct
+        except Exception as e:
+            raise Exception(f"Error getting top values: {str(e)}")
+
     def get_primary_keys(self, schema, table_name):
         self.cursor.execute("""
             SELECT COLUMN_NAME
@@ -2881,6 +3840,7 @@ class OracleConnector(DatabaseConnector):
                 dsn=dsn
             )
             self.cursor = self.connection.cursor()
+            self.cache_key = self._make_cache_key(config)
             logger.info("Oracle connection established successfully.")
         except Exception as e:
             logger.exception("Error connecting to Oracle")
@@ -3193,19 +4153,142 @@ class OracleConnector(DatabaseConnector):
         except Exception as e:
             logger.exception(f"Error getting column details for {schema}.{table}.{column}")
             raise Exception(f"Error getting column details: {str(e)}")
-        
-    def get_value_counts(self, schema: str, table: str, column: str) -> list:
+
+    NUMERIC_TYPES = ('number', 'float', 'integer', 'decimal')
+    TEXT_TYPES = ('varchar2', 'char', 'nvarchar2', 'nchar')
+    DATE_TYPES = ('date', 'timestamp')
+    # LOB, LONG and XML types cannot be counted distinct or partitioned by
+    UNGROUPABLE_TYPES = ('clob', 'nclob', 'blob', 'long', 'long raw', 'bfile', 'xmltype')
+
+    def _large_table_estimate(self, schema, table_name):
+        """Get the optimizer's row count when estimates are allowed and the table is large, else None"""
+        if self.exact_counts:
+            return None
+        # NUM_ROWS stays NULL until statistics are gathered
+        self.cursor.execute(
+            "SELECT num_rows FROM all_tables WHERE owner = :owner AND table_name = :table_name",
+            {"owner": schema, "table_name": table_name})
+        estimate = self.cursor.fetchone()
+        if estimate and estimate[0] and estimate[0] > self.ESTIMATE_MIN_ROWS:
+            return estimate[0]
+        return None
+
+    def get_table_column_details(self, schema, table_name, columns):
+        """Get detailed analysis for all columns of an Oracle table, one statement per batch of columns"""
+        return self._column_details_in_batches(schema, table_name, list(columns), self._get_column_details_batch)
+
+    def _get_column_details_batch(self, schema, table_name, columns):
+        """Get detailed analysis for a batch of columns of an Oracle table in a single statement.
+
+        Aggregates for every column share one scan; unique counts come from a
+        COUNT(*) OVER (PARTITION BY col) per column over the same inline view.
+        Unless exact_counts is set, distinct counts of tables over
+        ESTIMATE_MIN_ROWS come from APPROX_COUNT_DISTINCT instead, and unique
+        counts are skipped. Columns of UNGROUPABLE_TYPES are reported with None counts.
+        """
+        if not columns:
+            return {}
+        try:
+            approximate = self._large_table_estimate(schema, table_name) is not None
+            aggregates = []
+            partitions = []
+            layout = []
+            for i, column in enumerate(columns):
+                column_name = column[0]
+                data_type = (column[1] or '').lower()
+                if data_type in self.UNGROUPABLE_TYPES:
+                    layout.append((column_name, column[1], 'ungroupable'))
+                    continue
+                col = f'"{column_name}"'
+                aggregates.append(f'SUM(CASE WHEN {col} IS NULL THEN 1 ELSE 0 END)')
+                if approximate:
+                    aggregates.extend([f'APPROX_COUNT_DISTINCT({col})', 'NULL'])
+                    partitions.append(col)
+                else:
+                    aggregates.append(f'COUNT(DISTINCT {col})')
+                    aggregates.append(f'SUM(CASE WHEN pn_{i} = 1 THEN 1 ELSE 0 END)')
+                    partitions.append(f'{col}, COUNT(*) OVER (PARTITION BY {col}) AS pn_{i}')
+                if data_type in self.NUMERIC_TYPES:
+                    kind = 'numeric'
+                    aggregates.extend([f'MIN({col})', f'MAX({col})', f'AVG({col})'])
+                elif data_type in self.TEXT_TYPES:
+                    kind = 'text'
+                    aggregates.extend([f'MIN(LENGTH({col}))', f'MAX(LENGTH({col}))', f'AVG(LENGTH({col}))'])
+                elif data_type in self.DATE_TYPES:
+                    kind = 'date'
+                    aggregates.extend([f'MIN({col})', f'MAX({col})'])
+                else:
+                    kind = None
+                layout.append((column_name, column[1], kind))
+
+            row = ()
+            if aggregates:
+                query = f'''
+                    SELECT {", ".join(aggregates)}
+                    FROM (
+                        SELECT {", ".join(partitions)}
+                        FROM "{schema}"."{table_name}"
+                    ) t
+                '''
+                logger.debug(f"Table column details query:\n{query}")
+                self.cursor.execute(query)
+                row = self.cursor.fetchone()
+
+            details = {}
+            pos = 0
+            for column_name, data_type, kind in layout:
+                if kind == 'ungroupable':
+                    logger.warning(f"Skipping {data_type} column: {schema}.{table_name}.{column_name}")
+                    details[column_name] = {
+                        'data_type': data_type.lower(),
+                        'distinct_count': None,
+                        'null_count': None,
+                        'unique_count': None,
+                        'metrics': {}
+                    }
+                    continue
+                null_count, distinct_count, unique_count = row[pos:pos + 3]
+                pos += 3
+                metrics = {}
+                if kind == 'numeric':
+                    metrics = dict(zip(('min', 'max', 'avg'), row[pos:pos + 3]))
+                    pos += 3
+                elif kind == 'text':
+                    metrics = dict(zip(('min_length', 'max_length', 'avg_length'), row[pos:pos + 3]))
+                    pos += 3
+                elif kind == 'date':
+                    min_date, max_date = row[pos:pos + 2]
+                    metrics = {
+                        'min_date': str(min_date) if min_date else None,
+                        'max_date': str(max_date) if max_date else None
+                    }
+                    pos += 2
+                details[column_name] = {
+                    'data_type': data_type,
+                    'distinct_count': distinct_count or 0,
+                    'null_count': null_count or 0,
+                    'unique_count': None if approximate else unique_count or 0,
+                    'metrics': metrics
+                }
+            return details
+        except Exception as e:
+            logger.exception(f"Error getting column details for {schema}.{table_name}")
+            raise Exception(f"Error getting column details: {str(e)}")
+
+    def get_value_counts(self, schema: str, table: str, column: str, limit: int = 100) -> list:
         """Get value counts for a column in Oracle"""
         try:
             query = f'''
-                SELECT "{column}", COUNT(*) AS count
-                FROM "{schema}"."{table}"
-                GROUP BY "{column}"
-                ORDER BY count DESC
-
+                SELECT * FROM (
+                    SELECT "{column}", COUNT(*) AS count
+                    FROM "{schema}"."{table}"
+                    GROUP BY "{column}"
+                    ORDER BY count DESC
+                )
+                WHERE ROWNUM <= :limit
             '''
             logger.debug(f"Value counts query:\n{query}")
-            self.cursor.execute(query)
+            self.cursor.execute(query, {"limit": limit})
             results = self.cursor.fetchall()
             logger.debug(f"Fetched {len(results)} value counts for {schema}.{table}.{column}")
             return results
@@ -3213,6 +4296,118 @@ class OracleConnector(DatabaseConnector):
             logger.exception(f"Error getting value counts for {schema}.{table}.{column}")
             raise Exception(f"Error getting value counts: {str(e)}")
 
+    def get_freshness_tag(self, schema, table_name):
+        """Get the DML counters and DDL time of an Oracle table.
+
+        ALL_TAB_MODIFICATIONS is only flushed periodically, so the tag also
+        changes every FRESHNESS_WINDOW_SECONDS.
+        """
+        try:
+            self.cursor.execute("""
+                SELECT o.last_ddl_time, t.num_rows, m.inserts, m.updates, m.deletes, m.timestamp
+                FROM all_objects o
+                JOIN all_tables t ON t.owner = o.owner AND t.table_name = o.object_name
+                LEFT JOIN all_tab_modifications m
+                  ON m.table_owner = o.owner AND m.table_name = o.object_name AND m.partition_name IS NULL
+                WHERE o.owner = :owner AND o.object_name = :table_name AND o.object_type = 'TABLE'
+            """, {"owner": schema, "table_name": table_name})
+            result = self.cursor.fetchone()
+            return tuple(result) + (self._freshness_window(),) if result else None
+        except Exception as e:
+            logger.exception(f"Error getting table freshness for {schema}.{table_name}")
+            raise Exception(f"Error getting table freshness: {str(e)}")
+
+    def get_histogram(self, schema, table, column, n_buckets=10):
+        """Get a height-balanced histogram of a numeric column, binned with NTILE in Oracle"""
+        try:
+            query = f'''
+                SELECT MIN("{column}"), MAX("{column}"), COUNT(*)
+                FROM (
+                    SELECT "{column}", NTILE(:n_buckets) OVER (ORDER BY "{column}") AS b
+                    FROM "{schema}"."{table}"
+                    WHERE "{column}" IS NOT NULL
+                )
+                GROUP BY b
+                ORDER BY b
+            '''
+            self.cursor.execute(query, {"n_buckets": n_buckets})
+            return self.cursor.fetchall()
+        except Exception as e:
+            logger.exception(f"Error getting histogram for {schema}.{table}.{column}")
+            raise Exception(f"Error getting histogram: {str(e)}")
+
+    def get_box_stats(self, schema, table, column, max_outliers=100):
+        """Get box plot statistics of a numeric column in Oracle, with a sample of outliers"""
+        try:
+            value = f'CAST("{column}" AS BINARY_DOUBLE)'
+            query = f'''
+                WITH fences AS (
+                    SELECT q1, median, q3, q1 - 1.5 * (q3 - q1) AS lo, q3 + 1.5 * (q3 - q1) AS hi
+                    FROM (
+                        SELECT PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY "{column}") AS q1,
+                               PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY "{column}") AS median,
+                               PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY "{column}") AS q3
+                        FROM "{schema}"."{table}"
+                    )
+                )
+                SELECT f.q1, f.median, f.q3,
+                       MIN(CASE WHEN {value} >= f.lo THEN {value} END),
+                       MAX(CASE WHEN {value} <= f.hi THEN {value} END),
+                       f.lo, f.hi
+                FROM "{schema}"."{table}" CROSS JOIN fences f
+                GROUP BY f.q1, f.median, f.q3, f.lo, f.hi
+            '''
+            self.cursor.execute(query)
+            row = self.cursor.fetchone()
+            if not row or row[0] is None:
+                return ()
+            q1, median, q3, low, high, lo, hi = row
+            self.cursor.execute(f'''
+                SELECT v FROM (
+                    SELECT {value} AS v
+                    FROM "{schema}"."{table}"
+                    WHERE {value} < :lo OR {value} > :hi
+                )
+                WHERE ROWNUM <= :max_outliers
+            ''', {"lo": lo, "hi": hi, "max_outliers": max_outliers})
+            outliers = [r[0] for r in self.cursor.fetchall()]
+            return low, q1, median, q3, high, outliers
+        except Exception as e:
+            logger.exception(f"Error getting box plot statistics for {schema}.{table}.{column}")
+            raise Exception(f"Error getting box plot statistics: {str(e)}")
+
+    def get_top_values(self, schema, table, column, n=9):
+        """Get the most frequent values of a column and an exact 'others' total in Oracle"""
+        try:
+            query = f'''
+                SELECT v, SUM(n), COUNT(*), MIN(rn)
+                FROM (
+                    SELECT CASE WHEN rn <= :n THEN v END AS v, n, rn
+                    FROM (
+                        SELECT v, n, ROW_NUMBER() OVER (ORDER BY n DESC) AS rn
+                        FROM (
+                            SELECT "{column}" AS v, COUNT(*) AS n
+                            FROM "{schema}"."{table}"
+                            WHERE "{column}" IS NOT NULL
+                            GROUP BY "{column}"
+                        )
+                    )
+                )
+                GROUP BY v
+                ORDER BY MIN(rn)
+            '''
+            self.cursor.execute(query, {"n": n})
+            rows, others_count, others_distinct = [], 0, 0
+            for value, count, distinct, first_rank in self.cursor.fetchall():
+                if first_rank > n:
+                    others_count, others_distinct = count, distinct
+                else:
+                    rows.append((value, count))
+            return rows, others_count, others_distinct
+        except Exception as e:
+            logger.exception(f"Error getting top values for {schema}.{table}.{column}")
+            raise Exception(f"Error getting top values: {str(e)}")
+
 
     def get_sample_data(self, schema: str, table: str, limit: int = 100) -> list:
         """Get sample data from a table"""
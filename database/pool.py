@@ -0,0 +1,15 @@
+import os
+import streamlit as st
+from psycopg2 import pool
+
+# Page connections for several concurrent sessions plus their analysis workers;
+# sessions that still find it exhausted open a direct connection instead
+MAX_POOL_CONNECTIONS = max(16, (os.cpu_count() or 2) * 4)
+
+
+@st.cache_resource(show_spinner=False)
+def get_pool(db_type: str, **config):
+    """Get the process-wide connection pool for a database configuration"""
+    if db_type.lower() in ('postgres', 'postgresql'):
+        return pool.ThreadedConnectionPool(minconn=1, maxconn=MAX_POOL_CONNECTIONS, **config)
+    raise ValueError(f"Connection pooling is not supported for database type: {db_type}")
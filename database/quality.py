@@ -1,25 +1,39 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 from datetime import datetime, timedelta
 from database.utils import load_db_config, check_connection
+from database.analysis import get_all_tables_and_views, get_columns
 from collections import Counter
 import re
 
 PASS_ICON = "\u2705"  # ✅
 FAIL_ICON = "\u274C"  # ❌
 
-@st.cache_data(show_spinner=False)
-def get_cached_table_analysis(_connector, schema, table):
-    return _connector.get_table_analysis(schema, table)
+# How long quality-test row totals are reused; a changed freshness tag refreshes them sooner
+QUALITY_TABLE_CACHE_TTL = 300
 
-@st.cache_data(show_spinner=False)
-def get_cached_columns(_connector, schema, table):
-    return _connector.get_columns(schema, table)
 
-@st.cache_data(show_spinner=False)
-def get_all_cached_tables_and_views(_connector, schema):
-    return _connector.get_all_tables_and_views(schema)
+@st.cache_data(ttl=QUALITY_TABLE_CACHE_TTL, show_spinner=False)
+def get_exact_table_analysis(_connector, cache_key, schema, table, freshness_tag):
+    # Uniqueness checks and violation ratios compare against the row count, so never estimate it
+    exact_counts = _connector.exact_counts
+    _connector.exact_counts = True
+    try:
+        return _connector.get_table_analysis(schema, table)
+    finally:
+        _connector.exact_counts = exact_counts
+
+def get_cached_table_analysis(connector, schema, table):
+    # Keyed by the connected database; the freshness tag is None where the connector has none
+    return get_exact_table_analysis(connector, connector.cache_key, schema, table,
+                                    connector.get_freshness_tag(schema, table))
+
+def get_cached_columns(connector, schema, table):
+    # Shared with the explorer's catalog cache, keyed by the connected database
+    return get_columns(connector, connector.cache_key, schema, table)
+
+def get_all_cached_tables_and_views(connector, schema):
+    return get_all_tables_and_views(connector, connector.cache_key, schema)
 
 
 TYPE_TO_CATEGORY_PATTERNS = [
@@ -791,8 +805,9 @@ def run_quality_tests(connector, schema: str, table: str, column_test_map, custo
             if rows:
                 st.markdown(f"**{col_name} – {test_name}**")
                 try:
-                    df_rows = pd.DataFrame(rows, columns=[col[0] for col in columns])
-                    st.dataframe(df_rows.head(10))  # show only first 10 violating rows
+                    # Only the first 10 violating rows are shown, so only those are converted
+                    df_rows = pd.DataFrame(rows[:10], columns=[col[0] for col in columns])
+                    st.dataframe(df_rows)
                 except Exception as e:
                     st.warning(f"Error showing violations for {col_name} – {test_name}: {e}")
 
@@ -836,10 +851,10 @@ def show_quality_tests_page(connector, schema: str):
 
     try:
         connector.ensure_connected(st.session_state.db_config)
-        sample_data = connector.get_sample_data(schema, selected_table, limit=100)
+        sample_data = connector.get_sample_data(schema, selected_table, limit=10)
         if sample_data:
             sample_df = pd.DataFrame(sample_data, columns=[col[0] for col in columns])
-            st.dataframe(sample_df.head(10))
+            st.dataframe(sample_df)
         else:
             st.info("No sample data returned.")
     except Exception as e:
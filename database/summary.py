@@ -2,8 +2,8 @@ import streamlit as st
 import pandas as pd
 import psycopg2
 from decimal import Decimal
-import plotly.express as px
-from database.utils import load_db_config, decimal_to_float
+from database.utils import load_db_config
+from database.analysis import get_all_tables_and_views
 import io
 from datetime import datetime
 
@@ -72,7 +72,7 @@ def show_all_tables_summary(connector, schema):
     """Show summary statistics for all tables in the database"""
     try:
         # Get all tables
-        tables = connector.get_all_tables_and_views(schema)
+        tables = get_all_tables_and_views(connector, connector.cache_key, schema)
         
         # Create a list to store table statistics
         table_stats = []
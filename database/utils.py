@@ -1,8 +1,6 @@
 import configparser
-from decimal import Decimal
 import streamlit as st
 import os
-from pages.Configure_Connection import test_connection
 
 
 def load_db_config():
@@ -47,10 +45,11 @@ def load_db_config():
     return db_config
 
 
-def decimal_to_float(value):
-    return float(value) if isinstance(value, Decimal) else value
+# How long a connection check result is reused before profile.cfg is read again
+CONNECTION_CHECK_TTL = 30
 
 
+@st.cache_data(ttl=CONNECTION_CHECK_TTL, show_spinner=False)
 def check_connection():
     """Check if database connection is configured"""
     try:
@@ -2,48 +2,61 @@ import os
 from decimal import Decimal
 
 import configparser
+import functools
+import importlib
 import streamlit as st
 
+from database.utils import check_connection
+
+DRIVER_MODULES = {
+    "postgres": "psycopg2",
+    "mysql": "pymysql",
+    "mssql": "pyodbc",
+    "oracle": "oracledb",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _driver(db_type):
+    """Import the driver module for a database type once, on first use"""
+    return importlib.import_module(DRIVER_MODULES[db_type])
+
+
+def _connect_postgres(host, port, dbname, user, password):
+    return _driver("postgres").connect(host=host, port=int(port), dbname=dbname, user=user, password=password)
+
+
+def _connect_mysql(host, port, dbname, user, password):
+    return _driver("mysql").connect(host=host, port=int(port), database=dbname, user=user, password=password)
+
+
+def _connect_mssql(host, port, dbname, user, password):
+    return _driver("mssql").connect(
+        f"DRIVER={{ODBC Driver 17 for SQL Server}};"
+        f"SERVER={host},{port};"
+        f"DATABASE={dbname};"
+        f"UID={user};PWD={password}"
+    )
+
+
+def _connect_oracle(host, port, dbname, user, password):
+    return _driver("oracle").connect(user=user, password=password, dsn=f"{host}:{port}/{dbname}")
+
+
+CONNECT_FUNCTIONS = {
+    "postgres": _connect_postgres,
+    "mysql": _connect_mysql,
+    "mssql": _connect_mssql,
+    "oracle": _connect_oracle,
+}
+
+
 def test_connection(db_type, host, port, dbname, user, password):
+    connect = CONNECT_FUNCTIONS.get(db_type)
+    if connect is None:
+        return False, f"Unsupported database type: {db_type}"
     try:
-        if db_type == "postgres":
-            import psycopg2
-            conn = psycopg2.connect(
-                host=host,
-                port=int(port),
-                dbname=dbname,
-                user=user,
-                password=password
-            )
-            print("connection successful")
-        elif db_type == "mysql":
-            import pymysql
-            conn = pymysql.connect(
-                host=host,
-                port=int(port),
-                database=dbname,
-                user=user,
-                password=password
-            )
-        elif db_type == "mssql":
-            import pyodbc
-            conn = pyodbc.connect(
-                f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-                f"SERVER={host},{port};"
-                f"DATABASE={dbname};"
-                f"UID={user};PWD={password}"
-            )
-        elif db_type == "oracle":
-            import oracledb
-            dsn = f"{host}:{port}/{dbname}"
-            conn = oracledb.connect(
-                user=user,
-                password=password,
-                dsn=dsn
-            )
-        else:
-            return False, f"Unsupported database type: {db_type}"
-        
+        conn = connect(host, port, dbname, user, password)
         conn.close()
         return True, "Connection successful!"
     except Exception as e:
@@ -114,6 +127,9 @@ with st.form("save_config_form"):
         with open(config_path, "w") as configfile:
             config.write(configfile)
 
+        # The cached status predates this save
+        check_connection.clear()
+
         st.success("✅ Configuration saved successfully!")
 
 # Test Connection Button
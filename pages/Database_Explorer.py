@@ -1,15 +1,21 @@
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 from database.summary import show_all_tables_summary
 from database.utils import load_db_config, check_connection
 from database.quality import show_quality_tests_page
 from database.db_factory import DatabaseFactory
+from database.analysis import analyze_table, get_all_tables_and_views, clear_catalog_cache
 import pandas as pd
 import io
 from datetime import datetime
 import openpyxl
 
 # Set page config must be the first Streamlit command
-st.set_page_config(layout="wide")
+try:
+    st.set_page_config(layout="wide")
+except StreamlitAPIException:
+    # Already configured by the entry point for this run
+    pass
 
 def generate_detailed_statistics(connector, schema):
     """Generate detailed statistics for all tables and columns using connector methods only"""
@@ -28,6 +34,9 @@ def generate_detailed_statistics(connector, schema):
         if table_stats and 'columns' in table_stats:
             primary_keys = set(connector.get_primary_keys(schema, table_name))
             foreign_keys = connector.get_foreign_keys(schema, table_name)
+            # Details for every column of the table in one call
+            all_details = connector.get_table_column_details(
+                schema, table_name, [tuple(col) for col in table_stats['columns']])
             for col in table_stats['columns']:
                 col_name = col[0]  # column_name
                 data_type = col[1]  # data_type
@@ -44,7 +53,7 @@ def generate_detailed_statistics(connector, schema):
                     formatted_type += f"({precision},{scale})"
                 
                 # Get detailed column metrics
-                col_details = connector.get_column_details(schema, table_name, col_name)
+                col_details = all_details.get(col_name)
                 metrics = col_details.get('metrics', {}) if col_details else {}
                 def fmt(val):
                     from decimal import Decimal
@@ -106,10 +115,16 @@ def main():
         # Create database connector
         connector = DatabaseFactory.create_connector(db_type)
         connector.connect(db_config)
+        connector.exact_counts = st.sidebar.checkbox(
+            "Exact counts", value=False,
+            help="Row, distinct and median figures of tables over a million rows are estimated "
+                 "when the database supports it; tick for exact ones.")
    
         
         # Get all tables and views
-        objects = connector.get_all_tables_and_views(schema)
+        if st.sidebar.button("🔄 Refresh catalog"):
+            clear_catalog_cache()
+        objects = get_all_tables_and_views(connector, connector.cache_key, schema)
 
         if not objects:
             st.warning(f"No tables/views found in schema '{schema}'")
@@ -146,11 +161,22 @@ def main():
                 format_func=lambda x: f"{x} ({next(obj[1] for obj in objects if obj[0] == x)})"
             )
 
+            sample_percent = 100
+            if connector.supports_sampling:
+                sample_percent = st.sidebar.slider(
+                    "Sample %", 1, 100, 100,
+                    help="Profile a sample of the table's pages; counts are scaled up to estimates.")
+
+            show_visualizations = st.sidebar.checkbox(
+                "Visualizations", value=True,
+                help="Untick to skip the per-column charts and the queries behind them.")
+
             if st.sidebar.button("Analyze"):
                 object_type = next(obj[1] for obj in objects if obj[0] == selected)
+                # Views cannot be sampled
+                connector.sample_percent = sample_percent if object_type != 'VIEW' else 100
                 # Use connector-based analysis
-                from database.analysis import analyze_table
-                analyze_table(connector, schema, selected, object_type)
+                analyze_table(connector, schema, selected, object_type, show_visualizations)
 
     except Exception as e:
         st.error(f"Database error: {str(e)}")